@@ -216,11 +216,11 @@ async def generate_audio(
             platform
         )
         
-        # Get all audio files for this session
+        # Get all audio files for this session (already full rows)
         audio_files = audio_repo.find_by_session_id(session_id)
         
         return AudioFileListResponse(
-            audio_files=[audio_repo.find_by_id(af['id']) for af in audio_files if af['id']],
+            audio_files=[af for af in audio_files if af['id']],
             total=len(audio_files)
         )
         
@@ -275,7 +275,9 @@ async def list_conversations(
             filter_dict=filter_dict,
             limit=per_page,
             sort_by='created_at',
-            order='desc'
+            order='desc',
+            columns=conversation_repo.LIST_COLUMNS,
+            offset=offset
         )
         
         # Get total count
@@ -45,11 +45,13 @@ async def get_user_profiles(
             filter_dict['main_user_id'] = main_user_id
         
         # Get profiles with pagination
+        offset = (page - 1) * per_page
         profiles = user_profile_repo.find_all(
             filter_dict=filter_dict,
             limit=per_page,
             sort_by='created_at',
-            order='desc'
+            order='desc',
+            offset=offset
         )
         
         # Get total count
@@ -6,6 +6,7 @@ Flask REST API for summarizing WhatsApp group chats and generating TTS audio
 
 import os
 import logging
+import functools
 from flask import Flask
 from config import config, Config
 
@@ -20,63 +21,11 @@ def create_app(config_name=None):
     """Application factory"""
     if config_name is None:
         config_name = os.getenv('FLASK_ENV', 'development')
-    
-    app = Flask(__name__)
-    
-    # Load configuration
-    app.config.from_object(config[config_name])
-    config[config_name].init_app(app)
-    
-    # Import and register routes
-    from api.routes import create_app as create_routes
-    app = create_routes()
-    
-    return app
-
-def main():
-    """Main application entry point"""
-    try:
-        # Create app
-        app = create_app()
-        
-        # Get port from environment or use default
-        port = int(os.getenv('PORT', 5000))
-        
-        # Run app
-        logger.info(f"Starting WhatsApp Summarizer API on port {port}")
-        app.run(
-            host='0.0.0.0',
-            port=port,
-            debug=Config.DEBUG
-        )
-    except Exception as e:
-        logger.error(f"Failed to start application: {e}")
-        raise
-
-if __name__ == '__main__':
-    main() #!/usr/bin/env python3
-"""
-WhatsApp Summarizer API
-Flask REST API for summarizing WhatsApp group chats and generating TTS audio
-"""
-
-import os
-import logging
-from flask import Flask
-from config import config, Config
+    return _create_app(config_name)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-def create_app(config_name=None):
-    """Application factory"""
-    if config_name is None:
-        config_name = os.getenv('FLASK_ENV', 'development')
-    
+@functools.lru_cache(maxsize=None)
+def _create_app(config_name):
+    """Build the app once per configuration name"""
     app = Flask(__name__)
     
     # Load configuration
@@ -85,7 +34,7 @@ def create_app(config_name=None):
     
     # Import and register routes
     from api.routes import create_app as create_routes
-    app = create_routes()
+    create_routes(app)
     
     return app
 
@@ -98,16 +47,21 @@ def main():
         # Get port from environment or use default
         port = int(os.getenv('PORT', 5000))
         
+        # The reloader forks a watcher process; only run it when asked to
+        debug = Config.DEBUG
+        use_reloader = debug and os.getenv('FLASK_USE_RELOADER', '0') == '1'
+        
         # Run app
         logger.info(f"Starting WhatsApp Summarizer API on port {port}")
         app.run(
             host='0.0.0.0',
             port=port,
-            debug=Config.DEBUG
+            debug=debug,
+            use_reloader=use_reloader
         )
     except Exception as e:
         logger.error(f"Failed to start application: {e}")
         raise
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
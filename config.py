@@ -4,6 +4,16 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Directories already ensured by this process
+_created_dirs = set()
+
+def _ensure_dir(path):
+    """Create a directory once per process"""
+    if path in _created_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _created_dirs.add(path)
+
 class Config:
     """Configuration class for the application"""
     
@@ -19,6 +29,18 @@ class Config:
     SUPABASE_API_KEY = os.getenv('SUPABASE_API_KEY')
     DATABASE_URL = os.getenv('DATABASE_URL')  # Direct PostgreSQL connection string
     
+    # Supabase HTTP connection pool (shared by every repository)
+    SUPABASE_MAX_CONNECTIONS = int(os.getenv('SUPABASE_MAX_CONNECTIONS', 60))
+    SUPABASE_MAX_KEEPALIVE = int(os.getenv('SUPABASE_MAX_KEEPALIVE', 40))
+    SUPABASE_KEEPALIVE_EXPIRY = float(os.getenv('SUPABASE_KEEPALIVE_EXPIRY', 60))
+    SUPABASE_TIMEOUT = float(os.getenv('SUPABASE_TIMEOUT', 30))
+    SUPABASE_CONNECT_TIMEOUT = float(os.getenv('SUPABASE_CONNECT_TIMEOUT', 5))
+    SUPABASE_CONNECT_RETRIES = int(os.getenv('SUPABASE_CONNECT_RETRIES', 3))
+    SUPABASE_REQUEST_RETRIES = int(os.getenv('SUPABASE_REQUEST_RETRIES', 3))
+    SUPABASE_RETRY_MAX_DELAY = float(os.getenv('SUPABASE_RETRY_MAX_DELAY', 2))
+    SUPABASE_RETRY_BUDGET = float(os.getenv('SUPABASE_RETRY_BUDGET', 10))
+    SUPABASE_POOL_TIMEOUT = float(os.getenv('SUPABASE_POOL_TIMEOUT', 2))
+    
     # If DATABASE_URL is not provided, construct it from Supabase credentials
     if not DATABASE_URL and SUPABASE_URI and SUPABASE_API_KEY:
         # Extract host from Supabase URL and construct PostgreSQL connection
@@ -57,20 +79,24 @@ class Config:
     # File Upload Limits
     MAX_FILE_SIZE = int(os.getenv('MAX_FILE_SIZE', 16 * 1024 * 1024))  # 16MB default
     
+    # Settings that must be present for the application to start
+    REQUIRED_VARS = (
+        'SUPABASE_URI',
+        'SUPABASE_API_KEY',
+        'ELEVENLABS_API_KEY',
+        'OPENAI_API_KEY'
+    )
+    
+    @classmethod
+    def init_app(cls, app):
+        """Prepare storage folders for the application"""
+        _ensure_dir(cls.UPLOAD_FOLDER)
+        _ensure_dir(cls.AUDIO_FOLDER)
+    
     @classmethod
     def validate_config(cls):
         """Validate required configuration"""
-        required_vars = [
-            'SUPABASE_URI',
-            'SUPABASE_API_KEY',
-            'ELEVENLABS_API_KEY',
-            'OPENAI_API_KEY'
-        ]
-        
-        missing_vars = []
-        for var in required_vars:
-            if not getattr(cls, var):
-                missing_vars.append(var)
+        missing_vars = [var for var in cls.REQUIRED_VARS if not getattr(cls, var)]
         
         if missing_vars:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
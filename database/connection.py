@@ -4,9 +4,11 @@ Replaces SQLAlchemy connection logic with Supabase SDK.
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
+from postgrest.exceptions import APIError
+
 from .supabase import get_supabase_client
 
 logger = logging.getLogger(__name__)
@@ -33,6 +35,24 @@ def check_connection() -> bool:
         logger.error(f"Supabase connection check failed: {e}")
         return False
 
+def check_schema() -> List[str]:
+    """
+    List what the repositories need from database/sql/ but the database lacks
+    (functions, the profile upsert index, timestamp defaults and triggers).
+    
+    Returns:
+        Empty list when everything is installed
+    """
+    supabase = get_supabase_client()
+    try:
+        response = supabase.rpc('schema_status', {}).execute()
+    except APIError as e:
+        # PGRST202: the checker itself is missing, so functions.sql was never applied
+        if str(e.code) in ('PGRST202', '404'):
+            return ['function schema_status (database/sql/functions.sql not applied)']
+        raise
+    return response.data or []
+
 def get_current_timestamp() -> str:
     """Get current timestamp in ISO format for Supabase"""
     return datetime.utcnow().isoformat()
@@ -3,12 +3,19 @@ Database migration utilities for Supabase.
 Handles sample data creation using Supabase SDK.
 """
 
+import argparse
+import functools
 import logging
-import json
-from datetime import datetime
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, Any, List
 
-from .connection import init_database, get_current_timestamp
+from postgrest.exceptions import APIError
+
+from .supabase import get_supabase_client
+from .connection import init_database, check_schema
 from .repository import (
     ConversationSessionRepository, MainUserRepository, SummaryRepository,
     AudioFileRepository, AssistantSessionRepository, CalendarEventRepository,
@@ -17,18 +24,164 @@ from .repository import (
 
 logger = logging.getLogger(__name__)
 
+# Sample seed payloads for the SDK fallback (keep in sync with
+# database/sql/seed.sql). Repositories stamp rows in place, so
+# _create_sample_data_sdk works on shallow copies of these.
+
+_SAMPLE_MAIN_USER = MappingProxyType({
+    'username': 'test_user',
+    'email': 'test@example.com',
+    'voice_id': 'pNInz6obpgDQGcFmaJgB',
+    'voice_name': 'Adam',
+    'is_active': True,
+    'preferences': {
+        'summary_length': 'medium',
+        'voice_style': 'natural'
+    },
+    'connected_platforms': ['whatsapp', 'instagram'],
+    'platform_credentials': {},
+    'default_voice_settings': {
+        'stability': 0.5,
+        'similarity_boost': 0.75
+    },
+    'summary_preferences': {
+        'include_emotions': True,
+        'include_relationships': True
+    },
+    'privacy_settings': {
+        'share_analytics': False,
+        'store_audio': True
+    }
+})
+
+_SAMPLE_PROFILES = tuple(MappingProxyType(profile) for profile in [
+    {
+        'username': 'mom',
+        'platform': 'whatsapp',
+        'display_name': 'Mom',
+        'voice_id': 'EXAVITQu4vr4xnSDxMaL',
+        'voice_name': 'Bella',
+        'personality_traits': ['caring', 'supportive', 'loving'],
+        'interests': ['family', 'cooking', 'health'],
+        'communication_style': {
+            'formality': 'casual',
+            'emoji_usage': 'moderate',
+            'response_time': 'fast'
+        },
+        'relationship_type': 'family',
+        'trust_score': 0.95,
+        'frequency_score': 0.8
+    },
+    {
+        'username': 'best_friend',
+        'platform': 'instagram',
+        'display_name': 'Sarah',
+        'voice_id': '21m00Tcm4TlvDq8ikWAM',
+        'voice_name': 'Rachel',
+        'personality_traits': ['funny', 'loyal', 'adventurous'],
+        'interests': ['travel', 'music', 'photography'],
+        'communication_style': {
+            'formality': 'very_casual',
+            'emoji_usage': 'heavy',
+            'response_time': 'medium'
+        },
+        'relationship_type': 'friend',
+        'trust_score': 0.9,
+        'frequency_score': 0.7
+    }
+])
+
+_SAMPLE_CONVERSATION = MappingProxyType({
+    'platform': 'whatsapp',
+    'group_name': 'Family Group',
+    'main_user': 'test_user',
+    'status': 'uploaded',
+    # add_messages_bulk adds the two sample messages to this count
+    'total_messages': 0,
+    'conversation_type': 'group',
+    'participants': ['mom'],
+    'platform_specific_data': {
+        'whatsapp_data': {
+            'export_date': '2024-01-15',
+            'participant_count': 4
+        }
+    },
+    'date_range': {
+        'start_date': '2024-01-15T00:00:00Z',
+        'end_date': '2024-01-15T23:59:59Z'
+    }
+})
+
+_SAMPLE_MESSAGES = tuple(MappingProxyType(message) for message in [
+    {
+        'username': 'mom',
+        'content': 'Hey everyone! How\'s your day going? 😊',
+        'timestamp': '2024-01-15T10:30:00Z',
+        'message_type': 'text',
+        'is_important': False,
+        'platform_specific_data': {
+            'whatsapp_data': {
+                'message_id': 'msg_001',
+                'is_forwarded': False
+            }
+        }
+    },
+    {
+        'username': 'test_user',
+        'content': 'Pretty good! Just finished my project. How about you?',
+        'timestamp': '2024-01-15T10:32:00Z',
+        'message_type': 'text',
+        'is_important': False,
+        'platform_specific_data': {
+            'whatsapp_data': {
+                'message_id': 'msg_002',
+                'is_forwarded': False
+            }
+        }
+    }
+])
+
 class DatabaseMigrator:
     """Handles database migration and setup for Supabase"""
     
-    def __init__(self):
-        self.conversation_repo = ConversationSessionRepository()
-        self.main_user_repo = MainUserRepository()
-        self.summary_repo = SummaryRepository()
-        self.audio_repo = AudioFileRepository()
-        self.assistant_repo = AssistantSessionRepository()
-        self.calendar_repo = CalendarEventRepository()
-        self.user_profile_repo = UserProfileRepository()
-        self.platform_integration_repo = PlatformIntegrationRepository()
+    # Repositories are built on first use so setup-only runs never touch them
+    
+    @functools.cached_property
+    def client(self):
+        """Supabase client shared by every repository of this migrator"""
+        return get_supabase_client()
+    
+    @functools.cached_property
+    def conversation_repo(self) -> ConversationSessionRepository:
+        return ConversationSessionRepository(self.client)
+    
+    @functools.cached_property
+    def main_user_repo(self) -> MainUserRepository:
+        return MainUserRepository(self.client)
+    
+    @functools.cached_property
+    def summary_repo(self) -> SummaryRepository:
+        return SummaryRepository(self.client)
+    
+    @functools.cached_property
+    def audio_repo(self) -> AudioFileRepository:
+        return AudioFileRepository(self.client)
+    
+    @functools.cached_property
+    def assistant_repo(self) -> AssistantSessionRepository:
+        return AssistantSessionRepository(self.client)
+    
+    @functools.cached_property
+    def calendar_repo(self) -> CalendarEventRepository:
+        return CalendarEventRepository(self.client)
+    
+    @functools.cached_property
+    def user_profile_repo(self) -> UserProfileRepository:
+        return UserProfileRepository(self.client)
+    
+    @functools.cached_property
+    def platform_integration_repo(self) -> PlatformIntegrationRepository:
+        return PlatformIntegrationRepository(self.client)
     
     def setup_database(self):
         """Initialize Supabase connection"""
@@ -37,164 +190,111 @@ class DatabaseMigrator:
             init_database()
             
             logger.info("Supabase connection established successfully")
+            
+            missing = check_schema()
+            if missing:
+                logger.error(
+                    "Database schema is incomplete, apply database/sql/ (see README): %s",
+                    ", ".join(missing)
+                )
+                return False
             return True
         except Exception as e:
-            logger.error(f"Database setup failed: {e}")
+            logger.error("Database setup failed: %s", e)
             return False
     
     def create_sample_data(self):
-        """Create sample data for testing using Supabase SDK"""
+        """
+        Create sample data for testing.
+        
+        Uses the seed_sample_data function (database/sql/seed.sql) when it is
+        installed, which writes the whole seed in one transaction and one
+        round-trip, and falls back to the Supabase SDK only when the function
+        does not exist. Any other failure (e.g. the seed is already present)
+        is reported as is.
+        """
+        logger.info("Creating sample data...")
+        try:
+            response = self.client.rpc('seed_sample_data', {}).execute()
+            logger.info("Created sample data with main user ID: %s", response.data)
+            return True
+        except APIError as e:
+            # PGRST202: function not found in the schema cache; a bare 404 carries
+            # the HTTP status as an int code
+            if str(e.code) not in ('PGRST202', '404'):
+                logger.error("seed_sample_data failed: %s", e)
+                return False
+            logger.info("seed_sample_data is not installed, seeding through the SDK")
+        except Exception as e:
+            logger.error("seed_sample_data failed: %s", e)
+            return False
+        
+        return self._create_sample_data_sdk()
+    
+    def _create_sample_data_sdk(self):
+        """
+        Create sample data for testing using Supabase SDK.
+        
+        PostgREST commits every request on its own, so the seed is made
+        all-or-nothing by deleting the main user this run created, and the rows
+        hanging off it, if any later step fails. Nothing is deleted when the
+        user itself could not be created (e.g. it already exists).
+        """
+        main_user_id = None
         try:
-            logger.info("Creating sample data...")
-            
             # Create a sample main user
-            main_user_data = {
-                'username': 'test_user',
-                'email': 'test@example.com',
-                'voice_id': 'pNInz6obpgDQGcFmaJgB',
-                'voice_name': 'Adam',
-                'is_active': True,
-                'preferences': {
-                    'summary_length': 'medium',
-                    'voice_style': 'natural'
-                },
-                'connected_platforms': ['whatsapp', 'instagram'],
-                'platform_credentials': {},
-                'default_voice_settings': {
-                    'stability': 0.5,
-                    'similarity_boost': 0.75
-                },
-                'summary_preferences': {
-                    'include_emotions': True,
-                    'include_relationships': True
-                },
-                'privacy_settings': {
-                    'share_analytics': False,
-                    'store_audio': True
-                }
-            }
+            main_user_data = dict(_SAMPLE_MAIN_USER)
             
             main_user_id = self.main_user_repo.create(main_user_data)
             if not main_user_id:
-                logger.error("Failed to create sample main user")
-                return False
+                raise RuntimeError("Failed to create sample main user")
             
-            logger.info(f"Created sample main user with ID: {main_user_id}")
+            logger.info("Created sample main user with ID: %s", main_user_id)
             
-            # Create sample user profiles
+            # Create sample user profiles and conversation session. Both only
+            # depend on the main user, so the two inserts run concurrently.
             sample_profiles = [
-                {
-                    'username': 'mom',
-                    'platform': 'whatsapp',
-                    'main_user_id': main_user_id,
-                    'display_name': 'Mom',
-                    'voice_id': 'EXAVITQu4vr4xnSDxMaL',
-                    'voice_name': 'Bella',
-                    'personality_traits': ['caring', 'supportive', 'loving'],
-                    'interests': ['family', 'cooking', 'health'],
-                    'communication_style': {
-                        'formality': 'casual',
-                        'emoji_usage': 'moderate',
-                        'response_time': 'fast'
-                    },
-                    'relationship_type': 'family',
-                    'trust_score': 0.95,
-                    'frequency_score': 0.8
-                },
-                {
-                    'username': 'best_friend',
-                    'platform': 'instagram',
-                    'main_user_id': main_user_id,
-                    'display_name': 'Sarah',
-                    'voice_id': '21m00Tcm4TlvDq8ikWAM',
-                    'voice_name': 'Rachel',
-                    'personality_traits': ['funny', 'loyal', 'adventurous'],
-                    'interests': ['travel', 'music', 'photography'],
-                    'communication_style': {
-                        'formality': 'very_casual',
-                        'emoji_usage': 'heavy',
-                        'response_time': 'medium'
-                    },
-                    'relationship_type': 'friend',
-                    'trust_score': 0.9,
-                    'frequency_score': 0.7
-                }
+                {**profile, 'main_user_id': main_user_id} for profile in _SAMPLE_PROFILES
             ]
+            conversation_data = dict(_SAMPLE_CONVERSATION)
             
-            for profile_data in sample_profiles:
-                profile_id = self.user_profile_repo.create(profile_data)
-                if profile_id:
-                    logger.info(f"Created sample profile: {profile_data['display_name']}")
-            
-            # Create sample conversation session
-            conversation_data = {
-                'platform': 'whatsapp',
-                'group_name': 'Family Group',
-                'main_user': 'test_user',
-                'status': 'uploaded',
-                'total_messages': 2,
-                'conversation_type': 'group',
-                'platform_specific_data': {
-                    'whatsapp_data': {
-                        'export_date': '2024-01-15',
-                        'participant_count': 4
-                    }
-                },
-                'date_range': {
-                    'start_date': '2024-01-15T00:00:00Z',
-                    'end_date': '2024-01-15T23:59:59Z'
-                }
-            }
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                profiles_future = executor.submit(self.user_profile_repo.bulk_create, sample_profiles)
+                session_future = executor.submit(self.conversation_repo.create, conversation_data, True)
+                profile_ids = profiles_future.result()
+                session = session_future.result()
+            
+            if len(profile_ids) != len(sample_profiles):
+                raise RuntimeError("Failed to create sample profiles")
+            logger.info("Created %d sample profiles", len(profile_ids))
+            
+            if not session:
+                raise RuntimeError("Failed to create sample conversation session")
+            
+            logger.info("Created sample conversation session with ID: %s", session['id'])
+            
+            # Add sample messages
+            # conversation_session_id is resolved by add_messages_bulk
+            sample_messages = [dict(message) for message in _SAMPLE_MESSAGES]
             
-            session_id = self.conversation_repo.create(conversation_data)
-            if session_id:
-                logger.info(f"Created sample conversation session with ID: {session_id}")
-                
-                # Add sample messages
-                sample_messages = [
-                    {
-                        'conversation_session_id': session_id,
-                        'username': 'mom',
-                        'content': 'Hey everyone! How\'s your day going? 😊',
-                        'timestamp': '2024-01-15T10:30:00Z',
-                        'message_type': 'text',
-                        'is_important': False,
-                        'platform_specific_data': {
-                            'whatsapp_data': {
-                                'message_id': 'msg_001',
-                                'is_forwarded': False
-                            }
-                        }
-                    },
-                    {
-                        'conversation_session_id': session_id,
-                        'username': 'test_user',
-                        'content': 'Pretty good! Just finished my project. How about you?',
-                        'timestamp': '2024-01-15T10:32:00Z',
-                        'message_type': 'text',
-                        'is_important': False,
-                        'platform_specific_data': {
-                            'whatsapp_data': {
-                                'message_id': 'msg_002',
-                                'is_forwarded': False
-                            }
-                        }
-                    }
-                ]
-                
-                # Get the session to add messages
-                session = self.conversation_repo.find_by_id(session_id)
-                if session:
-                    for message_data in sample_messages:
-                        self.conversation_repo.add_message(session['session_id'], message_data)
-                    
-                    logger.info("Added sample messages to conversation")
+            # The inserted row carries the generated session_id
+            if not self.conversation_repo.add_messages_bulk(session['session_id'], sample_messages):
+                raise RuntimeError("Failed to add sample messages")
+            
+            logger.info("Added sample messages to conversation")
             
             logger.info("Sample data creation completed successfully")
             return True
             
         except Exception as e:
-            logger.error(f"Sample data creation failed: {e}")
+            logger.error("Sample data creation failed: %s", e)
+            # Every other seed row references the new user, so removing it
+            # rolls back exactly what this run wrote
+            if main_user_id:
+                try:
+                    self._delete_user(main_user_id)
+                except Exception as rollback_error:
+                    logger.error("Rolling back sample user %s failed: %s", main_user_id, rollback_error)
             return False
     
     def cleanup_test_data(self):
@@ -205,21 +305,31 @@ class DatabaseMigrator:
             # Delete test user and all related data
             test_user = self.main_user_repo.find_by_username('test_user')
             if test_user:
-                user_id = test_user['id']
-                
-                # Delete related data first (foreign key constraints)
-                # This would need to be done in the correct order based on your schema
-                # For now, we'll just delete the main user and let Supabase handle cascading
-                self.main_user_repo.delete(user_id)
+                self._delete_user(test_user['id'])
                 logger.info("Cleaned up test data successfully")
             
             return True
         except Exception as e:
-            logger.error(f"Cleanup failed: {e}")
+            logger.error("Cleanup failed: %s", e)
             return False
+    
+    def _delete_user(self, user_id: int):
+        """Delete a main user and all dependent rows"""
+        # cleanup_test_user (database/sql/functions.sql) removes the user and
+        # all dependent rows in one transaction
+        self.client.rpc('cleanup_test_user', {'uid': user_id}).execute()
 
-def run_migration():
-    """Run the database migration"""
+def run_migration(create_samples: bool = None):
+    """
+    Run the database migration.
+    
+    Args:
+        create_samples: Whether to seed sample data. Defaults to the
+            MIGRATE_SAMPLES environment variable (off unless set to '1').
+    """
+    if create_samples is None:
+        create_samples = os.getenv('MIGRATE_SAMPLES', '0') == '1'
+    
     migrator = DatabaseMigrator()
     
     # Setup database connection
@@ -228,7 +338,7 @@ def run_migration():
         return False
     
     # Create sample data
-    if not migrator.create_sample_data():
+    if create_samples and not migrator.create_sample_data():
         logger.error("Failed to create sample data")
         return False
     
@@ -236,4 +346,12 @@ def run_migration():
     return True
 
 if __name__ == "__main__":
-    run_migration() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the Supabase database migration")
+    parser.add_argument(
+        '--samples',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Create sample data (default: MIGRATE_SAMPLES env, off unless set to '1')"
+    )
+    args = parser.parse_args()
+    sys.exit(0 if run_migration(create_samples=args.samples) else 1)
@@ -4,8 +4,12 @@ These are documentation stubs - actual table operations use the Supabase SDK.
 """
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Union, ClassVar, Literal
+from dataclasses import dataclass, fields
+
+from .schemas import (
+    DateRange, VoiceSettings, EmotionContext, CommunicationStyle, PersonalityContext
+)
 
 # Type aliases for common field types
 JsonField = Dict[str, Any]
@@ -15,14 +19,43 @@ IntegerField = int
 BooleanField = bool
 FloatField = float
 
-@dataclass
-class ConversationSession:
+# Closed value sets for the String(50) enum-like columns (mirror api.models)
+PlatformField = Literal['whatsapp', 'instagram', 'discord', 'telegram', 'slack']
+ConversationStatusField = Literal['uploaded', 'processing', 'summarized', 'completed', 'failed']
+ConversationTypeField = Literal['group', 'direct', 'channel']
+MessageTypeField = Literal['text', 'media', 'system', 'reaction']
+RelationshipTypeField = Literal['friend', 'family', 'colleague', 'acquaintance']
+SummaryTypeField = Literal['dialogue', 'bullet_points']
+AudioStatusField = Literal['pending', 'processing', 'completed', 'failed']
+AssistantTypeField = Literal['elevenlabs', 'custom']
+EventStatusField = Literal['pending', 'created', 'failed']
+SyncFrequencyField = Literal['manual', 'daily', 'weekly']
+
+class TableModel:
+    """Base for table schema dataclasses"""
+    __slots__ = ()
+    
+    TABLE_NAME: ClassVar[str]
+    # Field names in declaration order, filled in once per class below
+    FIELDS: ClassVar[tuple] = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return column values as a dict (shallow, unlike dataclasses.asdict)"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Build an instance from a row, ignoring keys that are not columns"""
+        return cls(**{key: data[key] for key in data.keys() & TABLE_COLUMNS[cls.TABLE_NAME]})
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ConversationSession(TableModel):
     """
     conversation_sessions table
     
     Fields:
         id: Integer (Primary Key, Auto-increment)
-        session_id: String(36) (Unique, UUID)
+        session_id: UUID (Unique, Default: gen_random_uuid())
         platform: String(50) (Required) - whatsapp, instagram, discord, etc.
         group_name: String(255) (Required)
         main_user: String(255) (Required)
@@ -30,27 +63,31 @@ class ConversationSession:
         file_path: String(500) (Optional)
         total_messages: Integer (Default: 0)
         conversation_type: String(50) (Default: 'group') - group, direct, channel
-        platform_specific_data: JSON (Optional)
-        date_range: JSON (Optional) - start_date, end_date
+        platform_specific_data: JSONB (Optional)
+        date_range: JSONB (Optional) - start_date, end_date
+        participants: JSONB (Optional) - Usernames other than main_user, written at ingest and by add_session_messages
         created_at: DateTime (Default: now)
         updated_at: DateTime (Default: now, Auto-update)
     """
+    TABLE_NAME: ClassVar[str] = 'conversation_sessions'
+    
     id: Optional[IntegerField] = None
     session_id: Optional[StringField] = None
-    platform: Optional[StringField] = None
+    platform: Optional[PlatformField] = None
     group_name: Optional[StringField] = None
     main_user: Optional[StringField] = None
-    status: Optional[StringField] = None
+    status: Optional[ConversationStatusField] = None
     file_path: Optional[StringField] = None
     total_messages: Optional[IntegerField] = None
-    conversation_type: Optional[StringField] = None
+    conversation_type: Optional[ConversationTypeField] = None
     platform_specific_data: Optional[JsonField] = None
-    date_range: Optional[JsonField] = None
+    date_range: Optional[DateRange] = None
+    participants: Optional[List[StringField]] = None
     created_at: Optional[DateTimeField] = None
     updated_at: Optional[DateTimeField] = None
 
-@dataclass
-class PlatformMessage:
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PlatformMessage(TableModel):
     """
     platform_messages table
     
@@ -62,25 +99,27 @@ class PlatformMessage:
         timestamp: DateTime (Required)
         message_type: String(50) (Default: 'text') - text, media, system, reaction
         is_important: Boolean (Default: False)
-        platform_specific_data: JSON (Optional) - Platform-specific metadata
-        reactions: JSON (Optional) - For platforms with reactions
+        platform_specific_data: JSONB (Optional) - Platform-specific metadata
+        reactions: JSONB (Optional) - For platforms with reactions
         reply_to: String(255) (Optional) - For threaded conversations
         created_at: DateTime (Default: now)
     """
+    TABLE_NAME: ClassVar[str] = 'platform_messages'
+    
     id: Optional[IntegerField] = None
     conversation_session_id: Optional[IntegerField] = None
     username: Optional[StringField] = None
     content: Optional[StringField] = None
     timestamp: Optional[DateTimeField] = None
-    message_type: Optional[StringField] = None
+    message_type: Optional[MessageTypeField] = None
     is_important: Optional[BooleanField] = None
     platform_specific_data: Optional[JsonField] = None
     reactions: Optional[JsonField] = None
     reply_to: Optional[StringField] = None
     created_at: Optional[DateTimeField] = None
 
-@dataclass
-class MainUser:
+@dataclass(slots=True, frozen=True, kw_only=True)
+class MainUser(TableModel):
     """
     main_users table
     
@@ -91,15 +130,17 @@ class MainUser:
         voice_id: String(255) (Optional) - ElevenLabs voice ID
         voice_name: String(255) (Optional)
         is_active: Boolean (Default: True)
-        preferences: JSON (Optional)
-        connected_platforms: JSON (Optional) - List of platforms they use
-        platform_credentials: JSON (Optional) - Encrypted platform tokens
-        default_voice_settings: JSON (Optional)
-        summary_preferences: JSON (Optional)
-        privacy_settings: JSON (Optional)
+        preferences: JSONB (Optional)
+        connected_platforms: JSONB (Optional) - List of platforms they use
+        platform_credentials: JSONB (Optional) - Encrypted platform tokens
+        default_voice_settings: JSONB (Optional)
+        summary_preferences: JSONB (Optional)
+        privacy_settings: JSONB (Optional)
         created_at: DateTime (Default: now)
         updated_at: DateTime (Default: now, Auto-update)
     """
+    TABLE_NAME: ClassVar[str] = 'main_users'
+    
     id: Optional[IntegerField] = None
     username: Optional[StringField] = None
     email: Optional[StringField] = None
@@ -109,14 +150,14 @@ class MainUser:
     preferences: Optional[JsonField] = None
     connected_platforms: Optional[JsonField] = None
     platform_credentials: Optional[JsonField] = None
-    default_voice_settings: Optional[JsonField] = None
+    default_voice_settings: Optional[VoiceSettings] = None
     summary_preferences: Optional[JsonField] = None
     privacy_settings: Optional[JsonField] = None
     created_at: Optional[DateTimeField] = None
     updated_at: Optional[DateTimeField] = None
 
-@dataclass
-class UserProfile:
+@dataclass(slots=True, frozen=True, kw_only=True)
+class UserProfile(TableModel):
     """
     user_profiles table
     
@@ -130,23 +171,25 @@ class UserProfile:
         voice_name: String(255) (Optional)
         profile_picture: String(500) (Optional)
         is_active: Boolean (Default: True)
-        personality_traits: JSON (Optional) - friendly, professional, etc.
-        interests: JSON (Optional) - topics they talk about
-        communication_style: JSON (Optional) - formal, casual, emoji_heavy, etc.
+        personality_traits: JSONB (Optional) - friendly, professional, etc.
+        interests: JSONB (Optional) - topics they talk about
+        communication_style: JSONB (Optional) - formal, casual, emoji_heavy, etc.
         frequency_score: Float (Default: 0.0) - How often they interact
         last_interaction: DateTime (Optional)
         platform_user_id: String(255) (Optional) - Platform's internal user ID
-        platform_specific_data: JSON (Optional)
+        platform_specific_data: JSONB (Optional)
         relationship_type: String(50) (Default: 'friend') - friend, family, colleague, etc.
         trust_score: Float (Default: 0.5) - 0-1 scale
-        preferred_topics: JSON (Optional)
-        avoided_topics: JSON (Optional)
+        preferred_topics: JSONB (Optional)
+        avoided_topics: JSONB (Optional)
         created_at: DateTime (Default: now)
         updated_at: DateTime (Default: now, Auto-update)
     """
+    TABLE_NAME: ClassVar[str] = 'user_profiles'
+    
     id: Optional[IntegerField] = None
     username: Optional[StringField] = None
-    platform: Optional[StringField] = None
+    platform: Optional[PlatformField] = None
     main_user_id: Optional[IntegerField] = None
     display_name: Optional[StringField] = None
     voice_id: Optional[StringField] = None
@@ -155,20 +198,20 @@ class UserProfile:
     is_active: Optional[BooleanField] = None
     personality_traits: Optional[JsonField] = None
     interests: Optional[JsonField] = None
-    communication_style: Optional[JsonField] = None
+    communication_style: Optional[CommunicationStyle] = None
     frequency_score: Optional[FloatField] = None
     last_interaction: Optional[DateTimeField] = None
     platform_user_id: Optional[StringField] = None
     platform_specific_data: Optional[JsonField] = None
-    relationship_type: Optional[StringField] = None
+    relationship_type: Optional[RelationshipTypeField] = None
     trust_score: Optional[FloatField] = None
     preferred_topics: Optional[JsonField] = None
     avoided_topics: Optional[JsonField] = None
     created_at: Optional[DateTimeField] = None
     updated_at: Optional[DateTimeField] = None
 
-@dataclass
-class Summary:
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Summary(TableModel):
     """
     summaries table
     
@@ -177,34 +220,36 @@ class Summary:
         conversation_session_id: Integer (Foreign Key to conversation_sessions.id)
         main_user_id: Integer (Foreign Key to main_users.id)
         summary_text: Text (Required)
-        script_lines: JSON (Optional) - List of dialogue lines
-        participants: JSON (Optional)
+        script_lines: JSONB (Optional) - List of dialogue lines
+        participants: JSONB (Optional)
         summary_type: String(50) (Default: 'dialogue') - dialogue, bullet_points, etc.
         word_count: Integer (Default: 0)
         generated_by: String(50) (Default: 'gpt-4')
-        personality_context: JSON (Optional) - How personalities influenced summary
-        relationship_context: JSON (Optional) - Relationship dynamics
-        tone_analysis: JSON (Optional) - Overall conversation tone
+        personality_context: JSONB (Optional) - How personalities influenced summary
+        relationship_context: JSONB (Optional) - Relationship dynamics
+        tone_analysis: JSONB (Optional) - Overall conversation tone
         created_at: DateTime (Default: now)
         updated_at: DateTime (Default: now, Auto-update)
     """
+    TABLE_NAME: ClassVar[str] = 'summaries'
+    
     id: Optional[IntegerField] = None
     conversation_session_id: Optional[IntegerField] = None
     main_user_id: Optional[IntegerField] = None
     summary_text: Optional[StringField] = None
     script_lines: Optional[JsonField] = None
     participants: Optional[JsonField] = None
-    summary_type: Optional[StringField] = None
+    summary_type: Optional[SummaryTypeField] = None
     word_count: Optional[IntegerField] = None
     generated_by: Optional[StringField] = None
-    personality_context: Optional[JsonField] = None
+    personality_context: Optional[PersonalityContext] = None
     relationship_context: Optional[JsonField] = None
     tone_analysis: Optional[JsonField] = None
     created_at: Optional[DateTimeField] = None
     updated_at: Optional[DateTimeField] = None
 
-@dataclass
-class AudioFile:
+@dataclass(slots=True, frozen=True, kw_only=True)
+class AudioFile(TableModel):
     """
     audio_files table
     
@@ -221,11 +266,13 @@ class AudioFile:
         status: String(50) (Default: 'pending') - pending, processing, completed, failed
         error_message: Text (Optional)
         elevenlabs_generation_id: String(255) (Optional)
-        voice_settings: JSON (Optional) - Custom voice settings based on personality
-        emotion_context: JSON (Optional) - Emotional context for voice generation
+        voice_settings: JSONB (Optional) - Custom voice settings based on personality
+        emotion_context: JSONB (Optional) - Emotional context for voice generation
         created_at: DateTime (Default: now)
         updated_at: DateTime (Default: now, Auto-update)
     """
+    TABLE_NAME: ClassVar[str] = 'audio_files'
+    
     id: Optional[IntegerField] = None
     conversation_session_id: Optional[IntegerField] = None
     username: Optional[StringField] = None
@@ -235,46 +282,48 @@ class AudioFile:
     voice_id: Optional[StringField] = None
     duration: Optional[FloatField] = None
     file_size: Optional[IntegerField] = None
-    status: Optional[StringField] = None
+    status: Optional[AudioStatusField] = None
     error_message: Optional[StringField] = None
     elevenlabs_generation_id: Optional[StringField] = None
-    voice_settings: Optional[JsonField] = None
-    emotion_context: Optional[JsonField] = None
+    voice_settings: Optional[VoiceSettings] = None
+    emotion_context: Optional[EmotionContext] = None
     created_at: Optional[DateTimeField] = None
     updated_at: Optional[DateTimeField] = None
 
-@dataclass
-class AssistantSession:
+@dataclass(slots=True, frozen=True, kw_only=True)
+class AssistantSession(TableModel):
     """
     assistant_sessions table
     
     Fields:
         id: Integer (Primary Key, Auto-increment)
-        session_id: String(36) (Unique, UUID)
+        session_id: UUID (Unique, Default: gen_random_uuid())
         main_user_id: Integer (Foreign Key to main_users.id)
-        messages: JSON (Optional) - Array of message objects
-        context: JSON (Optional) - Calendar events, user preferences, etc.
+        messages: JSONB (Optional) - Array of message objects
+        context: JSONB (Optional) - Calendar events, user preferences, etc.
         is_active: Boolean (Default: True)
         assistant_type: String(50) (Default: 'elevenlabs') - elevenlabs, custom
-        user_profiles_context: JSON (Optional) - Relevant user profiles
-        conversation_history_context: JSON (Optional) - Recent conversations
+        user_profiles_context: JSONB (Optional) - Relevant user profiles
+        conversation_history_context: JSONB (Optional) - Recent conversations
         created_at: DateTime (Default: now)
         updated_at: DateTime (Default: now, Auto-update)
     """
+    TABLE_NAME: ClassVar[str] = 'assistant_sessions'
+    
     id: Optional[IntegerField] = None
     session_id: Optional[StringField] = None
     main_user_id: Optional[IntegerField] = None
     messages: Optional[JsonField] = None
     context: Optional[JsonField] = None
     is_active: Optional[BooleanField] = None
-    assistant_type: Optional[StringField] = None
+    assistant_type: Optional[AssistantTypeField] = None
     user_profiles_context: Optional[JsonField] = None
     conversation_history_context: Optional[JsonField] = None
     created_at: Optional[DateTimeField] = None
     updated_at: Optional[DateTimeField] = None
 
-@dataclass
-class CalendarEvent:
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CalendarEvent(TableModel):
     """
     calendar_events table
     
@@ -291,10 +340,12 @@ class CalendarEvent:
         status: String(50) (Default: 'pending') - pending, created, failed
         error_message: Text (Optional)
         related_conversation_id: String(36) (Optional)
-        related_participants: JSON (Optional)
+        related_participants: JSONB (Optional)
         created_at: DateTime (Default: now)
         updated_at: DateTime (Default: now, Auto-update)
     """
+    TABLE_NAME: ClassVar[str] = 'calendar_events'
+    
     id: Optional[IntegerField] = None
     main_user_id: Optional[IntegerField] = None
     title: Optional[StringField] = None
@@ -304,15 +355,15 @@ class CalendarEvent:
     location: Optional[StringField] = None
     calendar_id: Optional[StringField] = None
     google_event_id: Optional[StringField] = None
-    status: Optional[StringField] = None
+    status: Optional[EventStatusField] = None
     error_message: Optional[StringField] = None
     related_conversation_id: Optional[StringField] = None
     related_participants: Optional[JsonField] = None
     created_at: Optional[DateTimeField] = None
     updated_at: Optional[DateTimeField] = None
 
-@dataclass
-class PlatformIntegration:
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PlatformIntegration(TableModel):
     """
     platform_integrations table
     
@@ -321,22 +372,38 @@ class PlatformIntegration:
         platform: String(50) (Required) - whatsapp, instagram, discord, etc.
         main_user_id: Integer (Foreign Key to main_users.id)
         is_connected: Boolean (Default: False)
-        credentials: JSON (Optional) - Encrypted platform credentials
-        settings: JSON (Optional) - Platform-specific settings
+        credentials: JSONB (Optional) - Encrypted platform credentials
+        settings: JSONB (Optional) - Platform-specific settings
         last_sync: DateTime (Optional)
         sync_frequency: String(50) (Default: 'manual') - manual, daily, weekly
-        permissions: JSON (Optional) - What data we can access
+        permissions: JSONB (Optional) - What data we can access
         created_at: DateTime (Default: now)
         updated_at: DateTime (Default: now, Auto-update)
     """
+    TABLE_NAME: ClassVar[str] = 'platform_integrations'
+    
     id: Optional[IntegerField] = None
-    platform: Optional[StringField] = None
+    platform: Optional[PlatformField] = None
     main_user_id: Optional[IntegerField] = None
     is_connected: Optional[BooleanField] = None
     credentials: Optional[JsonField] = None
     settings: Optional[JsonField] = None
     last_sync: Optional[DateTimeField] = None
-    sync_frequency: Optional[StringField] = None
+    sync_frequency: Optional[SyncFrequencyField] = None
     permissions: Optional[JsonField] = None
     created_at: Optional[DateTimeField] = None
-    updated_at: Optional[DateTimeField] = None 
\ No newline at end of file
+    updated_at: Optional[DateTimeField] = None
+
+_TABLE_MODELS = (
+    ConversationSession, PlatformMessage, MainUser, UserProfile, Summary,
+    AudioFile, AssistantSession, CalendarEvent, PlatformIntegration
+)
+
+# Reflect over the dataclass fields once instead of on every conversion
+for _model in _TABLE_MODELS:
+    _model.FIELDS = tuple(field.name for field in fields(_model))
+
+# Column names of each table
+TABLE_COLUMNS: Dict[str, frozenset] = {
+    model.TABLE_NAME: frozenset(model.FIELDS) for model in _TABLE_MODELS
+}
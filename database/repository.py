@@ -3,59 +3,175 @@ Repository classes for database operations using Supabase SDK.
 Replaces SQLAlchemy ORM with direct Supabase table operations.
 """
 
+import functools
+import json
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import uuid
 
+from supabase import Client
+
 from .supabase import get_supabase_client
 from .connection import get_current_timestamp
+from .models import (
+    TABLE_COLUMNS, ConversationSession, PlatformMessage, MainUser, UserProfile, Summary,
+    AudioFile, AssistantSession, CalendarEvent, PlatformIntegration
+)
 
 logger = logging.getLogger(__name__)
 
 class BaseRepository:
     """Base repository with common CRUD operations using Supabase"""
     
-    def __init__(self, table_name: str):
-        self.table_name = table_name
-        self.supabase = get_supabase_client()
+    # Schema dataclass from database.models describing the table
+    model = None
+    
+    # Columns returned by list queries; subclasses leave out bulky or secret ones
+    LIST_COLUMNS = "*"
+    
+    # Upper bound on rows per list query (Supabase's default db-max-rows)
+    MAX_LIMIT = 1000
     
-    def create(self, data: Dict[str, Any]) -> Optional[int]:
-        """Create a new record"""
+    def __init__(self, table_name: str, client: Optional[Client] = None):
+        self.table_name = table_name
+        self.supabase = client or get_supabase_client()
+        self.columns = TABLE_COLUMNS.get(table_name)
+    
+    def _columns_only(self, data: Dict[str, Any], warn: bool = True) -> Dict[str, Any]:
+        """Drop keys that are not columns of this table before sending a write"""
+        if self.columns is None:
+            return data
+        if warn:
+            self._warn_dropped(data.keys() - self.columns)
+        return {key: data[key] for key in data.keys() & self.columns}
+    
+    def _warn_dropped(self, keys):
+        """Log payload keys that were left out of a write for not being columns"""
+        if keys:
+            logger.warning("Ignoring keys that are not columns of %s: %s", self.table_name, ", ".join(sorted(keys)))
+    
+    def _select_by_session_id(self, session_id: str):
+        """
+        Start a select on a child table of conversation_sessions filtered by the
+        parent's session_id. The inner embed does the join server-side, so no
+        separate session lookup is needed.
+        """
+        return self.supabase.table(self.table_name).select(
+            "*, conversation_sessions!inner(session_id)"
+        ).eq("conversation_sessions.session_id", session_id)
+    
+    @staticmethod
+    def _without_session(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop the embedded conversation_sessions object from joined rows"""
+        for row in rows:
+            row.pop('conversation_sessions', None)
+        return rows
+    
+    @staticmethod
+    def _keyset(query, sort_by: str, desc: bool, after: Optional[tuple] = None):
+        """
+        Order a query by (sort_by, id) and, given the (sort value, id) of the
+        last row already read, keep only the rows that follow it.
+        
+        Each page costs the same however deep it is, unlike an offset, and the
+        id tiebreaker keeps rows with equal sort values from being skipped or
+        repeated between pages. Rows with a NULL sort value come last in either
+        direction, and a NULL in after continues through them.
+        """
+        if after is not None:
+            value, record_id = after
+            op = "lt" if desc else "gt"
+            if value is None:
+                query = query.is_(sort_by, "null").filter("id", op, record_id)
+            else:
+                # Quoted because timestamps contain characters reserved by or=()
+                query = query.or_(
+                    f'{sort_by}.{op}."{value}",and({sort_by}.eq."{value}",id.{op}.{record_id}),'
+                    f'{sort_by}.is.null'
+                )
+        return query.order(sort_by, desc=desc, nullsfirst=False).order("id", desc=desc)
+    
+    def create(self, data: Dict[str, Any], return_row: bool = False) -> Optional[Any]:
+        """
+        Create a new record and return its ID.
+        
+        With return_row=True the inserted row (as echoed by the insert, with its
+        database defaults filled in) is returned instead, saving a follow-up read.
+        """
         try:
-            # Add timestamps if not present
-            if 'created_at' not in data:
-                data['created_at'] = get_current_timestamp()
-            if 'updated_at' not in data:
-                data['updated_at'] = get_current_timestamp()
-            
+            # created_at/updated_at come from column defaults (database/sql/columns.sql)
             # Handle UUID generation for session_id fields
             if 'session_id' in data and not data['session_id']:
                 data['session_id'] = str(uuid.uuid4())
             
-            response = self.supabase.table(self.table_name).insert(data).execute()
+            response = self.supabase.table(self.table_name).insert(self._columns_only(data)).execute()
             
             if response.data:
-                return response.data[0]['id']
+                return response.data[0] if return_row else response.data[0]['id']
             return None
         except Exception as e:
-            logger.error(f"Error creating record in {self.table_name}: {e}")
+            logger.error("Error creating record in %s: %s", self.table_name, e)
             return None
     
-    def find_by_id(self, record_id: int) -> Optional[Dict[str, Any]]:
-        """Find record by ID"""
+    def bulk_create(self, records: List[Dict[str, Any]], chunk_size: int = 500) -> List[int]:
+        """Create many records, one insert request per chunk of rows"""
+        try:
+            for data in records:
+                if 'session_id' in data and not data['session_id']:
+                    data['session_id'] = str(uuid.uuid4())
+            
+            if self.columns is not None:
+                self._warn_dropped(set().union(*(data.keys() for data in records)) - self.columns)
+            
+            # PostgREST accepts an array body; chunk to stay under payload limits
+            ids = []
+            for start in range(0, len(records), chunk_size):
+                chunk = [self._columns_only(data, warn=False) for data in records[start:start + chunk_size]]
+                response = self.supabase.table(self.table_name).insert(chunk).execute()
+                ids.extend(row['id'] for row in response.data or [])
+            return ids
+        except Exception as e:
+            logger.error("Error bulk creating records in %s: %s", self.table_name, e)
+            return []
+    
+    def find_by_id(self, record_id: int, columns: str = "*") -> Optional[Dict[str, Any]]:
+        """Find record by ID, optionally fetching only the given columns"""
         try:
-            response = self.supabase.table(self.table_name).select("*").eq("id", record_id).execute()
+            response = self.supabase.table(self.table_name).select(columns).eq("id", record_id).execute()
             return response.data[0] if response.data else None
         except Exception as e:
-            logger.error(f"Error finding record by ID in {self.table_name}: {e}")
+            logger.error("Error finding record by ID in %s: %s", self.table_name, e)
             return None
     
+    def find_by_ids(self, record_ids: List[int], columns: str = "*") -> Dict[int, Dict[str, Any]]:
+        """
+        Find several records by ID in one request, keyed by ID.
+        
+        Use this instead of calling find_by_id in a loop; IDs that do not
+        exist are simply missing from the result.
+        """
+        if not record_ids:
+            return {}
+        try:
+            response = self.supabase.table(self.table_name).select(columns).in_(
+                "id", list(dict.fromkeys(record_ids))
+            ).execute()
+            return {row['id']: row for row in response.data or []}
+        except Exception as e:
+            logger.error("Error finding records by IDs in %s: %s", self.table_name, e)
+            return {}
+    
     def find_all(self, filter_dict: Dict[str, Any] = None, limit: int = None, 
-                 sort_by: str = None, order: str = 'desc') -> List[Dict[str, Any]]:
-        """Find all records with optional filter"""
+                 sort_by: str = None, order: str = 'desc', columns: str = "*",
+                 offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Find records with optional filter, optionally fetching only the given columns.
+        
+        Returns at most limit rows (capped at MAX_LIMIT) starting at offset.
+        """
         try:
-            query = self.supabase.table(self.table_name).select("*")
+            query = self.supabase.table(self.table_name).select(columns)
             
             # Apply filters
             if filter_dict:
@@ -72,41 +188,50 @@ class BaseRepository:
                 else:
                     query = query.order(sort_by, desc=False)
             
-            # Apply limit
-            if limit:
-                query = query.limit(limit)
+            # Apply pagination
+            limit = min(limit or self.MAX_LIMIT, self.MAX_LIMIT)
+            query = query.range(offset, offset + limit - 1)
             
             response = query.execute()
             return response.data or []
         except Exception as e:
-            logger.error(f"Error finding records in {self.table_name}: {e}")
+            logger.error("Error finding records in %s: %s", self.table_name, e)
             return []
     
     def update(self, record_id: int, data: Dict[str, Any]) -> bool:
         """Update record by ID"""
         try:
-            # Add updated timestamp
-            data['updated_at'] = get_current_timestamp()
-            
-            response = self.supabase.table(self.table_name).update(data).eq("id", record_id).execute()
-            return len(response.data) > 0
+            # updated_at is set by the set_updated_at trigger
+            # Only the affected-row count comes back, not the updated row
+            response = self.supabase.table(self.table_name).update(
+                self._columns_only(data), count="exact", returning="minimal"
+            ).eq("id", record_id).execute()
+            return bool(response.count)
         except Exception as e:
-            logger.error(f"Error updating record in {self.table_name}: {e}")
+            logger.error("Error updating record in %s: %s", self.table_name, e)
             return False
     
     def delete(self, record_id: int) -> bool:
         """Delete record by ID"""
         try:
-            response = self.supabase.table(self.table_name).delete().eq("id", record_id).execute()
-            return len(response.data) > 0
+            response = self.supabase.table(self.table_name).delete(
+                count="exact", returning="minimal"
+            ).eq("id", record_id).execute()
+            return bool(response.count)
         except Exception as e:
-            logger.error(f"Error deleting record in {self.table_name}: {e}")
+            logger.error("Error deleting record in %s: %s", self.table_name, e)
             return False
     
-    def count(self, filter_dict: Dict[str, Any] = None) -> int:
-        """Count records with optional filter"""
+    def count(self, filter_dict: Dict[str, Any] = None, method: str = "exact") -> int:
+        """
+        Count records with optional filter.
+        
+        Sent as a HEAD request, so no rows come back, only the count. Pass
+        method="planned" or "estimated" where an approximate figure is enough;
+        those read the planner's statistics instead of scanning.
+        """
         try:
-            query = self.supabase.table(self.table_name).select("id", count="exact")
+            query = self.supabase.table(self.table_name).select("id", count=method, head=True)
             
             if filter_dict:
                 for key, value in filter_dict.items():
@@ -118,14 +243,27 @@ class BaseRepository:
             response = query.execute()
             return response.count or 0
         except Exception as e:
-            logger.error(f"Error counting records in {self.table_name}: {e}")
+            logger.error("Error counting records in %s: %s", self.table_name, e)
             return 0
 
 class ConversationSessionRepository(BaseRepository):
     """Conversation session repository for all platforms"""
     
-    def __init__(self):
-        super().__init__("conversation_sessions")
+    model = ConversationSession
+    
+    # Everything ConversationResponse needs, without date_range/participants
+    LIST_COLUMNS = (
+        "id, session_id, platform, group_name, main_user, status, total_messages, "
+        "conversation_type, platform_specific_data, created_at, updated_at"
+    )
+    
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__(self.model.TABLE_NAME, client)
+    
+    @functools.cached_property
+    def message_repo(self) -> 'PlatformMessageRepository':
+        """Message repository sharing this repository's client, built once"""
+        return PlatformMessageRepository(self.supabase)
     
     def find_by_session_id(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Find conversation session by session ID"""
@@ -133,7 +271,7 @@ class ConversationSessionRepository(BaseRepository):
             response = self.supabase.table(self.table_name).select("*").eq("session_id", session_id).execute()
             return response.data[0] if response.data else None
         except Exception as e:
-            logger.error(f"Error finding session by session_id: {e}")
+            logger.error("Error finding session by session_id: %s", e)
             return None
     
     def find_by_platform(self, platform: str, main_user: str) -> List[Dict[str, Any]]:
@@ -154,85 +292,98 @@ class ConversationSessionRepository(BaseRepository):
         """Update session status"""
         try:
             response = self.supabase.table(self.table_name).update({
-                'status': status,
-                'updated_at': get_current_timestamp()
-            }).eq("session_id", session_id).execute()
-            return len(response.data) > 0
+                'status': status
+            }, count="exact", returning="minimal").eq("session_id", session_id).execute()
+            return bool(response.count)
         except Exception as e:
-            logger.error(f"Error updating session status: {e}")
+            logger.error("Error updating session status: %s", e)
             return False
     
-    def find_recent_sessions(self, main_user: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Find recent conversation sessions for a user"""
-        return self.find_all(
-            filter_dict={'main_user': main_user},
-            limit=limit,
-            sort_by='created_at',
-            order='desc'
-        )
+    def find_recent_sessions(self, main_user: str, limit: int = 10,
+                             after: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """
+        Find recent conversation sessions for a user, newest first.
+        
+        Pass (created_at, id) of the last session already read as after for the next page.
+        """
+        try:
+            query = self.supabase.table(self.table_name).select(self.LIST_COLUMNS).eq("main_user", main_user)
+            response = self._keyset(query, "created_at", True, after).limit(limit).execute()
+            
+            return response.data or []
+        except Exception as e:
+            logger.error("Error finding recent sessions: %s", e)
+            return []
     
     def find_by_participant(self, participant: str, main_user: str) -> List[Dict[str, Any]]:
-        """Find sessions by participant (requires joining with messages)"""
+        """Find sessions by participant using the participants roll-up column"""
         try:
-            # First get message IDs for the participant
-            message_response = self.supabase.table("platform_messages").select(
-                "conversation_session_id"
-            ).eq("username", participant).execute()
-            
-            if not message_response.data:
-                return []
-            
-            session_ids = list(set([msg['conversation_session_id'] for msg in message_response.data]))
-            
-            # Then get the sessions
-            response = self.supabase.table(self.table_name).select("*").in_(
-                "id", session_ids
-            ).eq("main_user", main_user).execute()
+            # jsonb containment (@>) needs a JSON literal, not a Postgres array
+            response = self.supabase.table(self.table_name).select("*").eq(
+                "main_user", main_user
+            ).contains("participants", json.dumps([participant])).execute()
             
             return response.data or []
         except Exception as e:
-            logger.error(f"Error finding sessions by participant: {e}")
+            logger.error("Error finding sessions by participant: %s", e)
             return []
     
     def add_message(self, session_id: str, message: Dict[str, Any]) -> bool:
         """Add a message to a conversation session"""
+        return self.add_messages_bulk(session_id, [message])
+    
+    def add_messages_bulk(self, session_id: str, messages: List[Dict[str, Any]]) -> bool:
+        """
+        Add messages to a conversation session in one round-trip.
+        
+        add_session_messages (database/sql/functions.sql) inserts the messages
+        and bumps total_messages in the same transaction, so concurrent callers
+        cannot lose an increment.
+        """
         try:
-            # Get the conversation session ID
-            session = self.find_by_session_id(session_id)
-            if not session:
-                return False
-            
-            # Add the conversation session ID to the message
-            message['conversation_session_id'] = session['id']
+            message_repo = self.message_repo
+            if message_repo.columns is not None:
+                message_repo._warn_dropped(set().union(*(message.keys() for message in messages)) - message_repo.columns)
             
-            # Create the message
-            message_repo = PlatformMessageRepository()
-            message_id = message_repo.create(message)
+            response = self.supabase.rpc('add_session_messages', {
+                'sid': session_id,
+                'msgs': [message_repo._columns_only(message, warn=False) for message in messages]
+            }).execute()
             
-            if message_id:
-                # Update the total messages count
-                self.update(session['id'], {
-                    'total_messages': session.get('total_messages', 0) + 1
-                })
-                return True
-            return False
+            # NULL only when the session is missing; 0 for an empty batch is a success
+            return response.data is not None
         except Exception as e:
-            logger.error(f"Error adding message to session: {e}")
+            logger.error("Error adding messages to session: %s", e)
             return False
 
 class PlatformMessageRepository(BaseRepository):
     """Platform message repository"""
     
-    def __init__(self):
-        super().__init__("platform_messages")
+    model = PlatformMessage
     
-    def find_by_session(self, conversation_session_id: int) -> List[Dict[str, Any]]:
-        """Find all messages for a conversation session"""
-        return self.find_all(
-            filter_dict={'conversation_session_id': conversation_session_id},
-            sort_by='timestamp',
-            order='asc'
-        )
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__(self.model.TABLE_NAME, client)
+    
+    def find_by_session(self, conversation_session_id: int, after: Optional[tuple] = None,
+                        limit: int = None) -> List[Dict[str, Any]]:
+        """
+        Find messages for a conversation session in timestamp order.
+        
+        Pass (timestamp, id) of the last message already read as after to fetch
+        the next page; unlike an offset this stays cheap deep into a session.
+        """
+        try:
+            query = self.supabase.table(self.table_name).select("*").eq(
+                "conversation_session_id", conversation_session_id
+            )
+            response = self._keyset(query, "timestamp", False, after).limit(
+                min(limit or self.MAX_LIMIT, self.MAX_LIMIT)
+            ).execute()
+            
+            return response.data or []
+        except Exception as e:
+            logger.error("Error finding messages for session %s: %s", conversation_session_id, e)
+            return []
     
     def find_important_messages(self, conversation_session_id: int) -> List[Dict[str, Any]]:
         """Find important messages for a conversation session"""
@@ -244,8 +395,10 @@ class PlatformMessageRepository(BaseRepository):
 class MainUserRepository(BaseRepository):
     """Main user repository"""
     
-    def __init__(self):
-        super().__init__("main_users")
+    model = MainUser
+    
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__(self.model.TABLE_NAME, client)
     
     def find_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Find main user by username"""
@@ -253,7 +406,7 @@ class MainUserRepository(BaseRepository):
             response = self.supabase.table(self.table_name).select("*").eq("username", username).execute()
             return response.data[0] if response.data else None
         except Exception as e:
-            logger.error(f"Error finding user by username: {e}")
+            logger.error("Error finding user by username: %s", e)
             return None
     
     def find_by_email(self, email: str) -> Optional[Dict[str, Any]]:
@@ -262,7 +415,7 @@ class MainUserRepository(BaseRepository):
             response = self.supabase.table(self.table_name).select("*").eq("email", email).execute()
             return response.data[0] if response.data else None
         except Exception as e:
-            logger.error(f"Error finding user by email: {e}")
+            logger.error("Error finding user by email: %s", e)
             return None
     
     def update_voice_id(self, user_id: int, voice_id: str, voice_name: str) -> bool:
@@ -279,24 +432,24 @@ class MainUserRepository(BaseRepository):
     def add_connected_platform(self, user_id: int, platform: str) -> bool:
         """Add a platform to user's connected platforms"""
         try:
-            user = self.find_by_id(user_id)
-            if not user:
-                return False
+            # Read-free append by add_connected_platform (database/sql/functions.sql)
+            response = self.supabase.rpc('add_connected_platform', {
+                'uid': user_id,
+                'p': platform
+            }).execute()
             
-            connected_platforms = user.get('connected_platforms', [])
-            if platform not in connected_platforms:
-                connected_platforms.append(platform)
-                return self.update(user_id, {'connected_platforms': connected_platforms})
-            return True
+            return bool(response.data)
         except Exception as e:
-            logger.error(f"Error adding connected platform: {e}")
+            logger.error("Error adding connected platform: %s", e)
             return False
 
 class UserProfileRepository(BaseRepository):
     """User profile repository"""
     
-    def __init__(self):
-        super().__init__("user_profiles")
+    model = UserProfile
+    
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__(self.model.TABLE_NAME, client)
     
     def find_by_username(self, username: str, platform: str, main_user_id: int) -> Optional[Dict[str, Any]]:
         """Find user profile by username, platform, and main user"""
@@ -306,7 +459,7 @@ class UserProfileRepository(BaseRepository):
             ).eq("main_user_id", main_user_id).execute()
             return response.data[0] if response.data else None
         except Exception as e:
-            logger.error(f"Error finding profile by username: {e}")
+            logger.error("Error finding profile by username: %s", e)
             return None
     
     def find_by_main_user(self, main_user_id: int, platform: str = None) -> List[Dict[str, Any]]:
@@ -334,91 +487,85 @@ class UserProfileRepository(BaseRepository):
             'last_interaction': get_current_timestamp()
         })
     
-    def find_frequent_contacts(self, main_user_id: int, limit: int = 10) -> List[Dict[str, Any]]:
-        """Find most frequent contacts for a user"""
-        return self.find_all(
-            filter_dict={'main_user_id': main_user_id},
-            limit=limit,
-            sort_by='frequency_score',
-            order='desc'
-        )
+    def find_frequent_contacts(self, main_user_id: int, limit: int = 10,
+                               after: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """
+        Find most frequent contacts for a user.
+        
+        Pass (frequency_score, id) of the last profile already read as after for the next page.
+        """
+        try:
+            query = self.supabase.table(self.table_name).select("*").eq("main_user_id", main_user_id)
+            response = self._keyset(query, "frequency_score", True, after).limit(limit).execute()
+            
+            return response.data or []
+        except Exception as e:
+            logger.error("Error finding frequent contacts: %s", e)
+            return []
     
     def find_by_interests(self, main_user_id: int, interests: List[str]) -> List[Dict[str, Any]]:
-        """Find profiles by interests (requires JSON overlap query)"""
+        """Find profiles sharing at least one of the given interests"""
         try:
-            # This is a simplified version - Supabase supports JSON operations
-            # but the exact syntax may vary based on your setup
-            response = self.supabase.table(self.table_name).select("*").eq(
-                "main_user_id", main_user_id
-            ).execute()
-            
-            # Filter in Python for now - can be optimized with proper JSON queries
-            profiles = response.data or []
-            matching_profiles = []
+            # Filtered server-side by find_profiles_by_interests (database/sql/functions.sql)
+            response = self.supabase.rpc('find_profiles_by_interests', {
+                'uid': main_user_id,
+                'wanted': interests
+            }).execute()
             
-            for profile in profiles:
-                profile_interests = profile.get('interests', [])
-                if any(interest in profile_interests for interest in interests):
-                    matching_profiles.append(profile)
-            
-            return matching_profiles
+            return response.data or []
         except Exception as e:
-            logger.error(f"Error finding profiles by interests: {e}")
+            logger.error("Error finding profiles by interests: %s", e)
             return []
     
     def create_or_update_profile(self, profile_data: Dict[str, Any]) -> Optional[int]:
         """Create or update a user profile"""
         try:
-            # Check if profile exists
-            existing = self.find_by_username(
-                profile_data['username'],
-                profile_data['platform'],
-                profile_data['main_user_id']
-            )
+            # One upsert on the (main_user_id, platform, username) unique index
+            # (database/sql/indexes.sql) instead of a lookup then a write
+            response = self.supabase.table(self.table_name).upsert(
+                self._columns_only(profile_data),
+                on_conflict="main_user_id,platform,username"
+            ).execute()
             
-            if existing:
-                # Update existing profile
-                self.update(existing['id'], profile_data)
-                return existing['id']
-            else:
-                # Create new profile
-                return self.create(profile_data)
+            if response.data:
+                return response.data[0]['id']
+            return None
         except Exception as e:
-            logger.error(f"Error creating or updating profile: {e}")
+            logger.error("Error creating or updating profile: %s", e)
             return None
 
 class SummaryRepository(BaseRepository):
     """Summary repository"""
     
-    def __init__(self):
-        super().__init__("summaries")
+    model = Summary
+    
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__(self.model.TABLE_NAME, client)
     
     def find_by_session_id(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Find summary by conversation session ID"""
         try:
-            # First get the conversation session
-            session_repo = ConversationSessionRepository()
-            session = session_repo.find_by_session_id(session_id)
-            if not session:
-                return None
-            
-            # Then find the summary
-            response = self.supabase.table(self.table_name).select("*").eq(
-                "conversation_session_id", session['id']
-            ).execute()
-            return response.data[0] if response.data else None
+            response = self._select_by_session_id(session_id).limit(1).execute()
+            return self._without_session(response.data)[0] if response.data else None
         except Exception as e:
-            logger.error(f"Error finding summary by session_id: {e}")
+            logger.error("Error finding summary by session_id: %s", e)
             return None
     
-    def find_recent_summaries(self, main_user_id: int, limit: int = 10) -> List[Dict[str, Any]]:
-        """Find recent summaries for a user"""
-        return self.find_all(
-            filter_dict={'main_user_id': main_user_id},
-            limit=limit,
-            sort_by='created_at',
-            order='desc'
-        )
+    def find_recent_summaries(self, main_user_id: int, limit: int = 10,
+                              after: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """
+        Find recent summaries for a user, newest first.
+        
+        Pass (created_at, id) of the last summary already read as after for the next page.
+        """
+        try:
+            query = self.supabase.table(self.table_name).select("*").eq("main_user_id", main_user_id)
+            response = self._keyset(query, "created_at", True, after).limit(limit).execute()
+            
+            return response.data or []
+        except Exception as e:
+            logger.error("Error finding recent summaries: %s", e)
+            return []
     
     def find_by_participants(self, participants: List[str], main_user_id: int) -> List[Dict[str, Any]]:
         """Find summaries by participants (requires complex query)"""
@@ -427,51 +574,39 @@ class SummaryRepository(BaseRepository):
             # For now, return recent summaries for the user
             return self.find_recent_summaries(main_user_id, limit=20)
         except Exception as e:
-            logger.error(f"Error finding summaries by participants: {e}")
+            logger.error("Error finding summaries by participants: %s", e)
             return []
 
 class AudioFileRepository(BaseRepository):
     """Audio file repository"""
     
-    def __init__(self):
-        super().__init__("audio_files")
+    model = AudioFile
+    
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__(self.model.TABLE_NAME, client)
     
     def find_by_session_id(self, session_id: str) -> List[Dict[str, Any]]:
         """Find all audio files for a conversation session"""
         try:
-            # First get the conversation session
-            session_repo = ConversationSessionRepository()
-            session = session_repo.find_by_session_id(session_id)
-            if not session:
-                return []
-            
-            # Then find the audio files
-            response = self.supabase.table(self.table_name).select("*").eq(
-                "conversation_session_id", session['id']
-            ).order("line_number", desc=False).execute()
+            response = self._select_by_session_id(session_id).order(
+                "line_number", desc=False
+            ).execute()
             
-            return response.data or []
+            return self._without_session(response.data or [])
         except Exception as e:
-            logger.error(f"Error finding audio files by session_id: {e}")
+            logger.error("Error finding audio files by session_id: %s", e)
             return []
     
     def find_by_username(self, session_id: str, username: str) -> List[Dict[str, Any]]:
         """Find audio files for a specific user in a session"""
         try:
-            # First get the conversation session
-            session_repo = ConversationSessionRepository()
-            session = session_repo.find_by_session_id(session_id)
-            if not session:
-                return []
-            
-            # Then find the audio files for the user
-            response = self.supabase.table(self.table_name).select("*").eq(
-                "conversation_session_id", session['id']
-            ).eq("username", username).order("line_number", desc=False).execute()
+            response = self._select_by_session_id(session_id).eq(
+                "username", username
+            ).order("line_number", desc=False).execute()
             
-            return response.data or []
+            return self._without_session(response.data or [])
         except Exception as e:
-            logger.error(f"Error finding audio files by username: {e}")
+            logger.error("Error finding audio files by username: %s", e)
             return []
     
     def update_status(self, audio_file_id: int, status: str, file_path: str = None) -> bool:
@@ -484,27 +619,28 @@ class AudioFileRepository(BaseRepository):
     def find_completed_audio(self, session_id: str) -> List[Dict[str, Any]]:
         """Find completed audio files for a session"""
         try:
-            # First get the conversation session
-            session_repo = ConversationSessionRepository()
-            session = session_repo.find_by_session_id(session_id)
-            if not session:
-                return []
-            
-            # Then find the completed audio files
-            response = self.supabase.table(self.table_name).select("*").eq(
-                "conversation_session_id", session['id']
-            ).eq("status", "completed").order("line_number", desc=False).execute()
+            response = self._select_by_session_id(session_id).eq(
+                "status", "completed"
+            ).order("line_number", desc=False).execute()
             
-            return response.data or []
+            return self._without_session(response.data or [])
         except Exception as e:
-            logger.error(f"Error finding completed audio files: {e}")
+            logger.error("Error finding completed audio files: %s", e)
             return []
 
 class AssistantSessionRepository(BaseRepository):
     """Assistant session repository"""
     
-    def __init__(self):
-        super().__init__("assistant_sessions")
+    model = AssistantSession
+    
+    # Session listings leave out the message history and context blobs,
+    # which grow with every exchange; find_by_session_id returns them
+    LIST_COLUMNS = (
+        "id, session_id, main_user_id, is_active, assistant_type, created_at, updated_at"
+    )
+    
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__(self.model.TABLE_NAME, client)
     
     def find_by_session_id(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Find assistant session by session ID"""
@@ -512,7 +648,7 @@ class AssistantSessionRepository(BaseRepository):
             response = self.supabase.table(self.table_name).select("*").eq("session_id", session_id).execute()
             return response.data[0] if response.data else None
         except Exception as e:
-            logger.error(f"Error finding assistant session by session_id: {e}")
+            logger.error("Error finding assistant session by session_id: %s", e)
             return None
     
     def find_active_sessions(self, main_user_id: int) -> List[Dict[str, Any]]:
@@ -520,28 +656,29 @@ class AssistantSessionRepository(BaseRepository):
         return self.find_all({
             'main_user_id': main_user_id,
             'is_active': True
-        })
+        }, columns=self.LIST_COLUMNS)
     
     def add_message(self, session_id: str, message: Dict[str, Any]) -> bool:
         """Add a message to an assistant session"""
         try:
-            session = self.find_by_session_id(session_id)
-            if not session:
-                return False
+            # Appended server-side by assistant_append_message (database/sql/functions.sql)
+            response = self.supabase.rpc('assistant_append_message', {
+                'sid': session_id,
+                'msg': message
+            }).execute()
             
-            messages = session.get('messages', [])
-            messages.append(message)
-            
-            return self.update(session['id'], {'messages': messages})
+            return bool(response.data)
         except Exception as e:
-            logger.error(f"Error adding message to assistant session: {e}")
+            logger.error("Error adding message to assistant session: %s", e)
             return False
 
 class CalendarEventRepository(BaseRepository):
     """Calendar event repository"""
     
-    def __init__(self):
-        super().__init__("calendar_events")
+    model = CalendarEvent
+    
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__(self.model.TABLE_NAME, client)
     
     def find_by_user_id(self, main_user_id: int) -> List[Dict[str, Any]]:
         """Find all calendar events for a user"""
@@ -551,17 +688,23 @@ class CalendarEventRepository(BaseRepository):
             order='asc'
         )
     
-    def find_upcoming_events(self, main_user_id: int, limit: int = 10) -> List[Dict[str, Any]]:
-        """Find upcoming calendar events for a user"""
+    def find_upcoming_events(self, main_user_id: int, limit: int = 10,
+                             after: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """
+        Find upcoming calendar events for a user, soonest first.
+        
+        Pass (start_time, id) of the last event already read as after for the next page.
+        """
         try:
             current_time = get_current_timestamp()
-            response = self.supabase.table(self.table_name).select("*").eq(
+            query = self.supabase.table(self.table_name).select("*").eq(
                 "main_user_id", main_user_id
-            ).gte("start_time", current_time).order("start_time", desc=False).limit(limit).execute()
+            ).gte("start_time", current_time)
+            response = self._keyset(query, "start_time", False, after).limit(limit).execute()
             
             return response.data or []
         except Exception as e:
-            logger.error(f"Error finding upcoming events: {e}")
+            logger.error("Error finding upcoming events: %s", e)
             return []
     
     def update_google_event_id(self, event_id: int, google_event_id: str) -> bool:
@@ -574,8 +717,16 @@ class CalendarEventRepository(BaseRepository):
 class PlatformIntegrationRepository(BaseRepository):
     """Platform integration repository"""
     
-    def __init__(self):
-        super().__init__("platform_integrations")
+    model = PlatformIntegration
+    
+    # Listings never need the stored platform credentials
+    LIST_COLUMNS = (
+        "id, platform, main_user_id, is_connected, settings, last_sync, "
+        "sync_frequency, permissions, created_at, updated_at"
+    )
+    
+    def __init__(self, client: Optional[Client] = None):
+        super().__init__(self.model.TABLE_NAME, client)
     
     def find_by_user_and_platform(self, main_user_id: int, platform: str) -> Optional[Dict[str, Any]]:
         """Find platform integration by user and platform"""
@@ -585,7 +736,7 @@ class PlatformIntegrationRepository(BaseRepository):
             ).eq("platform", platform).execute()
             return response.data[0] if response.data else None
         except Exception as e:
-            logger.error(f"Error finding platform integration: {e}")
+            logger.error("Error finding platform integration: %s", e)
             return None
     
     def find_connected_platforms(self, main_user_id: int) -> List[Dict[str, Any]]:
@@ -593,7 +744,7 @@ class PlatformIntegrationRepository(BaseRepository):
         return self.find_all({
             'main_user_id': main_user_id,
             'is_connected': True
-        })
+        }, columns=self.LIST_COLUMNS)
     
     def update_credentials(self, integration_id: int, credentials: Dict[str, Any]) -> bool:
         """Update platform credentials"""
@@ -0,0 +1,41 @@
+"""
+Shapes of the structured JSON columns.
+These are TypedDicts, so rows stay plain dicts at runtime; the classes only
+document the keys for readers and type checkers.
+"""
+
+from typing import Dict, List, Literal, TypedDict
+
+class DateRange(TypedDict, total=False):
+    """conversation_sessions.date_range - ISO 8601 strings"""
+    start_date: str
+    end_date: str
+
+class VoiceSettings(TypedDict, total=False):
+    """ElevenLabs voice settings (audio_files.voice_settings, main_users.default_voice_settings)"""
+    stability: float
+    similarity_boost: float
+    style: float
+    use_speaker_boost: bool
+
+class EmotionContext(TypedDict, total=False):
+    """audio_files.emotion_context"""
+    detected_emotions: List[str]
+    intensity: Literal['low', 'medium', 'high']
+    tone: Literal['positive', 'negative', 'neutral']
+
+class CommunicationStyle(TypedDict, total=False):
+    """user_profiles.communication_style"""
+    formality: str
+    emoji_usage: str
+    response_time: str
+
+class ParticipantContext(TypedDict, total=False):
+    """Value of summaries.personality_context, keyed by participant username"""
+    traits: List[str]
+    interests: List[str]
+    communication_style: CommunicationStyle
+    relationship_type: str
+    trust_score: float
+
+PersonalityContext = Dict[str, ParticipantContext]
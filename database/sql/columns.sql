@@ -0,0 +1,150 @@
+-- Column type and default changes for tables created in the Supabase dashboard.
+-- Every statement is safe to re-run. Apply with the Supabase SQL editor (or psql).
+
+-- JSON columns are stored as jsonb: parsed once on write instead of on every
+-- read, smaller on disk, and usable with jsonb operators and GIN indexes.
+
+ALTER TABLE conversation_sessions
+    ALTER COLUMN platform_specific_data TYPE jsonb USING platform_specific_data::jsonb,
+    ALTER COLUMN date_range TYPE jsonb USING date_range::jsonb;
+
+ALTER TABLE platform_messages
+    ALTER COLUMN platform_specific_data TYPE jsonb USING platform_specific_data::jsonb,
+    ALTER COLUMN reactions TYPE jsonb USING reactions::jsonb;
+
+ALTER TABLE main_users
+    ALTER COLUMN preferences TYPE jsonb USING preferences::jsonb,
+    ALTER COLUMN connected_platforms TYPE jsonb USING connected_platforms::jsonb,
+    ALTER COLUMN platform_credentials TYPE jsonb USING platform_credentials::jsonb,
+    ALTER COLUMN default_voice_settings TYPE jsonb USING default_voice_settings::jsonb,
+    ALTER COLUMN summary_preferences TYPE jsonb USING summary_preferences::jsonb,
+    ALTER COLUMN privacy_settings TYPE jsonb USING privacy_settings::jsonb;
+
+ALTER TABLE user_profiles
+    ALTER COLUMN personality_traits TYPE jsonb USING personality_traits::jsonb,
+    ALTER COLUMN interests TYPE jsonb USING interests::jsonb,
+    ALTER COLUMN communication_style TYPE jsonb USING communication_style::jsonb,
+    ALTER COLUMN platform_specific_data TYPE jsonb USING platform_specific_data::jsonb,
+    ALTER COLUMN preferred_topics TYPE jsonb USING preferred_topics::jsonb,
+    ALTER COLUMN avoided_topics TYPE jsonb USING avoided_topics::jsonb;
+
+ALTER TABLE summaries
+    ALTER COLUMN script_lines TYPE jsonb USING script_lines::jsonb,
+    ALTER COLUMN participants TYPE jsonb USING participants::jsonb,
+    ALTER COLUMN personality_context TYPE jsonb USING personality_context::jsonb,
+    ALTER COLUMN relationship_context TYPE jsonb USING relationship_context::jsonb,
+    ALTER COLUMN tone_analysis TYPE jsonb USING tone_analysis::jsonb;
+
+ALTER TABLE audio_files
+    ALTER COLUMN voice_settings TYPE jsonb USING voice_settings::jsonb,
+    ALTER COLUMN emotion_context TYPE jsonb USING emotion_context::jsonb;
+
+ALTER TABLE assistant_sessions
+    ALTER COLUMN messages TYPE jsonb USING messages::jsonb,
+    ALTER COLUMN context TYPE jsonb USING context::jsonb,
+    ALTER COLUMN user_profiles_context TYPE jsonb USING user_profiles_context::jsonb,
+    ALTER COLUMN conversation_history_context TYPE jsonb USING conversation_history_context::jsonb;
+
+ALTER TABLE calendar_events
+    ALTER COLUMN related_participants TYPE jsonb USING related_participants::jsonb;
+
+ALTER TABLE platform_integrations
+    ALTER COLUMN credentials TYPE jsonb USING credentials::jsonb,
+    ALTER COLUMN settings TYPE jsonb USING settings::jsonb,
+    ALTER COLUMN permissions TYPE jsonb USING permissions::jsonb;
+
+-- session_id values are UUIDs; store them natively (16 bytes instead of 36
+-- characters of text) so session lookups compare fixed-width keys. Clients keep
+-- sending the canonical string form, which Postgres parses on input.
+ALTER TABLE conversation_sessions
+    ALTER COLUMN session_id TYPE uuid USING session_id::uuid,
+    ALTER COLUMN session_id SET DEFAULT gen_random_uuid();
+
+ALTER TABLE assistant_sessions
+    ALTER COLUMN session_id TYPE uuid USING session_id::uuid,
+    ALTER COLUMN session_id SET DEFAULT gen_random_uuid();
+
+-- created_at/updated_at are filled in by Postgres: now() on insert and the
+-- set_updated_at trigger on every update, so the application never sends them.
+CREATE OR REPLACE FUNCTION set_updated_at()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$;
+
+ALTER TABLE conversation_sessions
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+CREATE OR REPLACE TRIGGER set_updated_at
+    BEFORE UPDATE ON conversation_sessions
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+ALTER TABLE platform_messages
+    ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE main_users
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+CREATE OR REPLACE TRIGGER set_updated_at
+    BEFORE UPDATE ON main_users
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+ALTER TABLE user_profiles
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+CREATE OR REPLACE TRIGGER set_updated_at
+    BEFORE UPDATE ON user_profiles
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+ALTER TABLE summaries
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+CREATE OR REPLACE TRIGGER set_updated_at
+    BEFORE UPDATE ON summaries
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+ALTER TABLE audio_files
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+CREATE OR REPLACE TRIGGER set_updated_at
+    BEFORE UPDATE ON audio_files
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+ALTER TABLE assistant_sessions
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+CREATE OR REPLACE TRIGGER set_updated_at
+    BEFORE UPDATE ON assistant_sessions
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+ALTER TABLE calendar_events
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+CREATE OR REPLACE TRIGGER set_updated_at
+    BEFORE UPDATE ON calendar_events
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+ALTER TABLE platform_integrations
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET DEFAULT now();
+CREATE OR REPLACE TRIGGER set_updated_at
+    BEFORE UPDATE ON platform_integrations
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+-- Participant roll-up: usernames other than main_user, written at ingest and
+-- extended by add_session_messages (functions.sql), so find_by_participant
+-- reads sessions directly instead of scanning platform_messages. The UPDATE backfills sessions created before the column.
+ALTER TABLE conversation_sessions ADD COLUMN IF NOT EXISTS participants jsonb;
+
+UPDATE conversation_sessions cs
+   SET participants = coalesce((
+           SELECT jsonb_agg(DISTINCT pm.username)
+             FROM platform_messages pm
+            WHERE pm.conversation_session_id = cs.id
+              AND pm.username <> cs.main_user
+       ), '[]')
+ WHERE cs.participants IS NULL;
@@ -0,0 +1,183 @@
+-- Postgres functions called from the application through client.rpc().
+-- Apply with the Supabase SQL editor (or psql) after the tables exist.
+
+-- cleanup_test_user(uid)
+-- Deletes a main user and every row that references it in a single call,
+-- children first so it works whether or not the foreign keys cascade.
+-- Used by DatabaseMigrator.cleanup_test_data().
+CREATE OR REPLACE FUNCTION cleanup_test_user(uid integer)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    session_ids integer[];
+BEGIN
+    SELECT coalesce(array_agg(cs.id), '{}')
+      INTO session_ids
+      FROM conversation_sessions cs
+      JOIN main_users mu ON mu.username = cs.main_user
+     WHERE mu.id = uid;
+
+    DELETE FROM audio_files WHERE conversation_session_id = ANY (session_ids);
+    DELETE FROM summaries
+     WHERE main_user_id = uid OR conversation_session_id = ANY (session_ids);
+    DELETE FROM platform_messages WHERE conversation_session_id = ANY (session_ids);
+    DELETE FROM conversation_sessions WHERE id = ANY (session_ids);
+
+    DELETE FROM user_profiles WHERE main_user_id = uid;
+    DELETE FROM assistant_sessions WHERE main_user_id = uid;
+    DELETE FROM calendar_events WHERE main_user_id = uid;
+    DELETE FROM platform_integrations WHERE main_user_id = uid;
+
+    DELETE FROM main_users WHERE id = uid;
+END;
+$$;
+
+-- add_session_messages(sid, msgs)
+-- Inserts a JSON array of platform_messages rows into the session with the
+-- given session_id, adds their count to total_messages and merges their
+-- senders (other than main_user) into participants, in one transaction.
+-- Returns the number of messages added, or NULL when the session does not
+-- exist.
+-- Used by ConversationSessionRepository.add_message()/add_messages_bulk().
+CREATE OR REPLACE FUNCTION add_session_messages(sid uuid, msgs jsonb)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    csid integer;
+    added integer;
+BEGIN
+    SELECT id INTO csid FROM conversation_sessions WHERE session_id = sid;
+    IF csid IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO platform_messages (
+        conversation_session_id, username, content, timestamp, message_type,
+        is_important, platform_specific_data, reactions, reply_to
+    )
+    SELECT csid, m.username, m.content, m.timestamp,
+           coalesce(m.message_type, 'text'), coalesce(m.is_important, false),
+           m.platform_specific_data, m.reactions, m.reply_to
+      FROM jsonb_populate_recordset(NULL::platform_messages, msgs) AS m;
+    GET DIAGNOSTICS added = ROW_COUNT;
+
+    UPDATE conversation_sessions cs
+       SET total_messages = coalesce(cs.total_messages, 0) + added,
+           participants = (
+               SELECT coalesce(jsonb_agg(p.username ORDER BY p.username), '[]')
+                 FROM (
+                       SELECT jsonb_array_elements_text(coalesce(cs.participants, '[]')) AS username
+                       UNION
+                       SELECT m.username
+                         FROM jsonb_populate_recordset(NULL::platform_messages, msgs) AS m
+                        WHERE m.username IS NOT NULL
+                          AND m.username <> cs.main_user
+                      ) AS p
+           )
+     WHERE cs.id = csid;
+
+    RETURN added;
+END;
+$$;
+
+-- find_profiles_by_interests(uid, wanted)
+-- A main user's profiles whose interests array shares at least one entry
+-- with wanted. PostgREST's ov filter only applies to Postgres arrays, so the
+-- jsonb ?| test is exposed through this function instead.
+-- Used by UserProfileRepository.find_by_interests().
+CREATE OR REPLACE FUNCTION find_profiles_by_interests(uid integer, wanted text[])
+RETURNS SETOF user_profiles
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT *
+      FROM user_profiles
+     WHERE main_user_id = uid
+       AND interests ?| wanted;
+$$;
+
+-- assistant_append_message(sid, msg)
+-- Appends one message object to assistant_sessions.messages in place, so the
+-- history is never read back or rewritten and concurrent appends are not lost.
+-- Returns true when the session exists.
+-- Used by AssistantSessionRepository.add_message().
+CREATE OR REPLACE FUNCTION assistant_append_message(sid uuid, msg jsonb)
+RETURNS boolean
+LANGUAGE sql
+AS $$
+    UPDATE assistant_sessions
+       SET messages = coalesce(messages, '[]'::jsonb) || jsonb_build_array(msg)
+     WHERE session_id = sid
+    RETURNING true;
+$$;
+
+-- add_connected_platform(uid, p)
+-- Adds p to main_users.connected_platforms unless it is already listed, in a
+-- single statement. Returns true when the user exists.
+-- Used by MainUserRepository.add_connected_platform().
+CREATE OR REPLACE FUNCTION add_connected_platform(uid integer, p text)
+RETURNS boolean
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE main_users
+       SET connected_platforms = coalesce(connected_platforms, '[]'::jsonb) || jsonb_build_array(p)
+     WHERE id = uid
+       AND NOT coalesce(connected_platforms, '[]'::jsonb) ? p;
+
+    RETURN EXISTS (SELECT 1 FROM main_users WHERE id = uid);
+END;
+$$;
+
+-- schema_status()
+-- Lists what the application needs from database/sql/ but cannot find:
+-- the functions above, the upsert's unique index, and the created_at /
+-- updated_at defaults and trigger from columns.sql. Empty when complete.
+-- Used by database.connection.check_schema().
+CREATE OR REPLACE FUNCTION schema_status()
+RETURNS text[]
+LANGUAGE sql
+STABLE
+AS $$
+    WITH app_tables(name) AS (
+        VALUES ('conversation_sessions'), ('platform_messages'), ('main_users'),
+               ('user_profiles'), ('summaries'), ('audio_files'),
+               ('assistant_sessions'), ('calendar_events'), ('platform_integrations')
+    )
+    SELECT coalesce(array_agg(missing), '{}')
+      FROM (
+        SELECT 'function ' || f AS missing
+          FROM unnest(ARRAY['cleanup_test_user', 'add_session_messages',
+                            'find_profiles_by_interests', 'assistant_append_message',
+                            'add_connected_platform']) AS f
+         WHERE NOT EXISTS (
+                SELECT 1
+                  FROM pg_proc p
+                  JOIN pg_namespace n ON n.oid = p.pronamespace
+                 WHERE n.nspname = 'public' AND p.proname = f)
+        UNION ALL
+        SELECT 'index ' || i
+          FROM unnest(ARRAY['ix_user_profiles_user_platform_username']) AS i
+         WHERE to_regclass('public.' || i) IS NULL
+        UNION ALL
+        SELECT 'default ' || c.table_name || '.' || c.column_name
+          FROM information_schema.columns c
+          JOIN app_tables t ON t.name = c.table_name
+         WHERE c.table_schema = 'public'
+           AND c.column_name IN ('created_at', 'updated_at')
+           AND c.column_default IS NULL
+        UNION ALL
+        SELECT 'trigger set_updated_at on ' || c.table_name
+          FROM information_schema.columns c
+          JOIN app_tables t ON t.name = c.table_name
+         WHERE c.table_schema = 'public'
+           AND c.column_name = 'updated_at'
+           AND NOT EXISTS (
+                SELECT 1
+                  FROM pg_trigger tg
+                 WHERE tg.tgrelid = format('public.%I', c.table_name)::regclass
+                   AND tg.tgname = 'set_updated_at')
+      ) AS m;
+$$;
@@ -0,0 +1,70 @@
+-- Indexes matching the query shapes in database/repository.py.
+-- Every statement is safe to re-run. Apply with the Supabase SQL editor (or psql).
+-- Names follow ix_<table>_<columns> so they stay unique across tables.
+
+-- PlatformMessageRepository.find_by_session: messages of a session by timestamp
+CREATE INDEX IF NOT EXISTS ix_platform_messages_session_timestamp
+    ON platform_messages (conversation_session_id, timestamp);
+
+-- AudioFileRepository.find_by_session_id / find_completed_audio: audio files of a
+-- session in playback order
+CREATE INDEX IF NOT EXISTS ix_audio_files_session_line
+    ON audio_files (conversation_session_id, line_number);
+
+-- CalendarEventRepository.find_by_user_id / find_upcoming_events: a user's
+-- events by start time
+CREATE INDEX IF NOT EXISTS ix_calendar_events_user_start
+    ON calendar_events (main_user_id, start_time);
+
+-- PlatformMessageRepository.find_important_messages: only the few flagged
+-- messages are indexed, so this stays a fraction of the table's size
+CREATE INDEX IF NOT EXISTS ix_platform_messages_session_important
+    ON platform_messages (conversation_session_id, timestamp)
+    WHERE is_important;
+
+-- UserProfileRepository.find_frequent_contacts: a user's top-K profiles by
+-- frequency, read straight off the index in order
+CREATE INDEX IF NOT EXISTS ix_user_profiles_user_frequency
+    ON user_profiles (main_user_id, frequency_score DESC);
+
+-- ConversationSessionRepository.find_by_participant: participants @> '["name"]'
+CREATE INDEX IF NOT EXISTS ix_conversation_sessions_participants
+    ON conversation_sessions USING gin (participants jsonb_path_ops);
+
+-- find_profiles_by_interests: interests ?| wanted. The default jsonb_ops
+-- class is used because jsonb_path_ops does not support the ?| operator.
+CREATE INDEX IF NOT EXISTS ix_user_profiles_interests
+    ON user_profiles USING gin (interests);
+
+-- UserProfileRepository.create_or_update_profile: the ON CONFLICT target of
+-- its upsert. One profile per (main user, platform, username); remove any
+-- existing duplicates before creating it.
+CREATE UNIQUE INDEX IF NOT EXISTS ix_user_profiles_user_platform_username
+    ON user_profiles (main_user_id, platform, username);
+
+-- ConversationSessionRepository.find_recent_sessions and the conversations
+-- list endpoint: a user's sessions newest first, optionally per platform.
+-- Equality columns lead and the sort column follows, so the top page is read
+-- in index order with no separate sort.
+CREATE INDEX IF NOT EXISTS ix_conversation_sessions_user_created
+    ON conversation_sessions (main_user, created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_conversation_sessions_user_platform_created
+    ON conversation_sessions (main_user, platform, created_at DESC);
+
+-- UserProfileRepository.find_by_relationship_type
+CREATE INDEX IF NOT EXISTS ix_user_profiles_user_relationship
+    ON user_profiles (main_user_id, relationship_type);
+
+-- AudioFileRepository.find_completed_audio: completed files of a session in
+-- playback order
+CREATE INDEX IF NOT EXISTS ix_audio_files_session_status_line
+    ON audio_files (conversation_session_id, status, line_number);
+
+-- AssistantSessionRepository.find_active_sessions
+CREATE INDEX IF NOT EXISTS ix_assistant_sessions_user_active
+    ON assistant_sessions (main_user_id)
+    WHERE is_active;
+
+-- PlatformIntegrationRepository.find_by_user_and_platform / find_connected_platforms
+CREATE INDEX IF NOT EXISTS ix_platform_integrations_user_platform
+    ON platform_integrations (main_user_id, platform);
@@ -0,0 +1,76 @@
+-- Sample data used by DatabaseMigrator.create_sample_data().
+-- Keep in sync with the _SAMPLE_* payloads in database/migrations.py,
+-- which are used when this function has not been installed.
+
+-- seed_sample_data()
+-- Inserts the test user, their profiles, a conversation and its messages
+-- in one transaction and returns the new main_users.id.
+CREATE OR REPLACE FUNCTION seed_sample_data()
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    uid integer;
+    sid integer;
+BEGIN
+    INSERT INTO main_users (
+        username, email, voice_id, voice_name, is_active, preferences,
+        connected_platforms, platform_credentials, default_voice_settings,
+        summary_preferences, privacy_settings, created_at, updated_at
+    ) VALUES (
+        'test_user', 'test@example.com', 'pNInz6obpgDQGcFmaJgB', 'Adam', true,
+        '{"summary_length": "medium", "voice_style": "natural"}',
+        '["whatsapp", "instagram"]',
+        '{}',
+        '{"stability": 0.5, "similarity_boost": 0.75}',
+        '{"include_emotions": true, "include_relationships": true}',
+        '{"share_analytics": false, "store_audio": true}',
+        now(), now()
+    )
+    RETURNING id INTO uid;
+
+    INSERT INTO user_profiles (
+        username, platform, main_user_id, display_name, voice_id, voice_name,
+        personality_traits, interests, communication_style, relationship_type,
+        trust_score, frequency_score, created_at, updated_at
+    ) VALUES
+        ('mom', 'whatsapp', uid, 'Mom', 'EXAVITQu4vr4xnSDxMaL', 'Bella',
+         '["caring", "supportive", "loving"]',
+         '["family", "cooking", "health"]',
+         '{"formality": "casual", "emoji_usage": "moderate", "response_time": "fast"}',
+         'family', 0.95, 0.8, now(), now()),
+        ('best_friend', 'instagram', uid, 'Sarah', '21m00Tcm4TlvDq8ikWAM', 'Rachel',
+         '["funny", "loyal", "adventurous"]',
+         '["travel", "music", "photography"]',
+         '{"formality": "very_casual", "emoji_usage": "heavy", "response_time": "medium"}',
+         'friend', 0.9, 0.7, now(), now());
+
+    INSERT INTO conversation_sessions (
+        session_id, platform, group_name, main_user, status, total_messages,
+        conversation_type, participants, platform_specific_data, date_range,
+        created_at, updated_at
+    ) VALUES (
+        gen_random_uuid(), 'whatsapp', 'Family Group', 'test_user',
+        'uploaded', 2, 'group', '["mom"]',
+        '{"whatsapp_data": {"export_date": "2024-01-15", "participant_count": 4}}',
+        '{"start_date": "2024-01-15T00:00:00Z", "end_date": "2024-01-15T23:59:59Z"}',
+        now(), now()
+    )
+    RETURNING id INTO sid;
+
+    INSERT INTO platform_messages (
+        conversation_session_id, username, content, timestamp, message_type,
+        is_important, platform_specific_data, created_at
+    ) VALUES
+        (sid, 'mom', 'Hey everyone! How''s your day going? 😊',
+         '2024-01-15T10:30:00Z', 'text', false,
+         '{"whatsapp_data": {"message_id": "msg_001", "is_forwarded": false}}',
+         now()),
+        (sid, 'test_user', 'Pretty good! Just finished my project. How about you?',
+         '2024-01-15T10:32:00Z', 'text', false,
+         '{"whatsapp_data": {"message_id": "msg_002", "is_forwarded": false}}',
+         now());
+
+    RETURN uid;
+END;
+$$;
@@ -3,8 +3,12 @@ Supabase client configuration and management
 """
 
 import logging
+import random
+import threading
+import time
 from typing import Optional
-from supabase import create_client, Client
+import httpx
+from supabase import Client, ClientOptions
 
 from ..config import Config
 
@@ -12,6 +16,7 @@ logger = logging.getLogger(__name__)
 
 # Global Supabase client instance
 _supabase_client: Optional[Client] = None
+_supabase_client_lock = threading.Lock()
 
 def get_supabase_client() -> Client:
     """
@@ -26,7 +31,10 @@ def get_supabase_client() -> Client:
     global _supabase_client
     
     if _supabase_client is None:
-        _supabase_client = _create_supabase_client()
+        with _supabase_client_lock:
+            # Re-check under the lock so concurrent first callers share one client
+            if _supabase_client is None:
+                _supabase_client = _create_supabase_client()
     
     return _supabase_client
 
@@ -52,10 +60,9 @@ def _create_supabase_client() -> Client:
         raise ValueError("SUPABASE_API_KEY environment variable is required")
     
     try:
-        # Create Supabase client
-        client = create_client(supabase_url=supabase_url, supabase_key=supabase_key)
+        # Create Supabase client (connects lazily on the first table operation)
+        client = _PooledClient.create(supabase_url=supabase_url, supabase_key=supabase_key, options=ClientOptions())
         
-        # Test the connection
         logger.info("Supabase client created successfully")
         
         return client
@@ -64,13 +71,121 @@ def _create_supabase_client() -> Client:
         logger.error(f"Failed to create Supabase client: {e}")
         raise ValueError(f"Failed to initialize Supabase client: {e}")
 
+class _PooledClient(Client):
+    """
+    Supabase client whose PostgREST requests use the pooled HTTP/2 client.
+    
+    The pooled client is attached to PostgREST only. Passing it through
+    ClientOptions.httpx_client would share it with auth, storage and functions,
+    and postgrest and storage3 both set base_url and headers on the client they
+    are given, so the first storage access would redirect every later table
+    request. The other sub-clients keep their own default clients.
+    """
+    
+    _postgrest_http_client: Optional[httpx.Client] = None
+    
+    def _init_postgrest_client(self, **kwargs):
+        # PostgREST is rebuilt on auth events; reuse the same pool each time
+        if self._postgrest_http_client is None:
+            self._postgrest_http_client = _create_http_client()
+        return Client._init_postgrest_client(**{**kwargs, 'http_client': self._postgrest_http_client})
+
+class _RetryingTransport(httpx.HTTPTransport):
+    """
+    HTTP transport that retries transient Supabase failures with exponential
+    backoff and full jitter.
+    
+    A 503 from PostgREST (it could not reach Postgres, so the request never
+    ran) is retried for every method. Failures that may have happened after
+    the server acted (dropped connections, 502/504) are only retried for
+    idempotent methods, so inserts and RPC calls are never applied twice.
+    
+    Pool timeouts are not retried: the pool is already exhausted and retrying
+    only adds load. A retry is only started if its backoff ends within the
+    request's retry budget, checked after each attempt returns.
+    """
+    
+    IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+    
+    def __init__(self, *args, request_retries: int = 3, base_delay: float = 0.1,
+                 max_delay: float = 2.0, retry_budget: float = 10.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.request_retries = request_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget
+    
+    def _out_of_retries(self, attempt: int, delay: float, deadline: float) -> bool:
+        """Whether no retry may follow this attempt, by count or by deadline"""
+        return attempt == self.request_retries or time.monotonic() + delay > deadline
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        idempotent = request.method in self.IDEMPOTENT_METHODS
+        deadline = time.monotonic() + self.retry_budget
+        for attempt in range(self.request_retries + 1):
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+            try:
+                response = super().handle_request(request)
+            except (httpx.RemoteProtocolError, httpx.ReadError):
+                if self._out_of_retries(attempt, delay, deadline) or not idempotent:
+                    raise
+            else:
+                retryable = response.status_code == 503 or (
+                    idempotent and response.status_code in (502, 504)
+                )
+                if not retryable or self._out_of_retries(attempt, delay, deadline):
+                    return response
+                response.close()
+            
+            logger.warning("Retrying Supabase %s %s (attempt %d)", request.method, request.url.path, attempt + 1)
+            time.sleep(delay)
+
+def _create_http_client() -> httpx.Client:
+    """
+    Create the HTTP client used for Supabase requests.
+    
+    HTTP/2 multiplexes concurrent PostgREST calls over one TLS connection, and
+    a large keep-alive pool avoids repeating handshakes between requests.
+    Failed connection attempts are retried by the transport, and transient
+    request failures by _RetryingTransport.
+    
+    Returns:
+        httpx.Client: Pooled HTTP/2 client
+    """
+    # With an explicit transport, pool settings must be given to it, not the client
+    transport = _RetryingTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=Config.SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.SUPABASE_MAX_KEEPALIVE,
+            keepalive_expiry=Config.SUPABASE_KEEPALIVE_EXPIRY
+        ),
+        retries=Config.SUPABASE_CONNECT_RETRIES,
+        request_retries=Config.SUPABASE_REQUEST_RETRIES,
+        max_delay=Config.SUPABASE_RETRY_MAX_DELAY,
+        retry_budget=Config.SUPABASE_RETRY_BUDGET
+    )
+    # follow_redirects matches the client postgrest would build for itself
+    return httpx.Client(
+        transport=transport,
+        follow_redirects=True,
+        # A short pool timeout fails fast when every connection is busy instead
+        # of holding the worker for the full request timeout
+        timeout=httpx.Timeout(
+            Config.SUPABASE_TIMEOUT,
+            connect=Config.SUPABASE_CONNECT_TIMEOUT,
+            pool=Config.SUPABASE_POOL_TIMEOUT
+        )
+    )
+
 def reset_supabase_client():
     """
     Reset the global Supabase client instance.
     Useful for testing or when configuration changes.
     """
     global _supabase_client
-    _supabase_client = None
+    with _supabase_client_lock:
+        _supabase_client = None
     logger.info("Supabase client reset")
 
 def test_supabase_connection() -> bool:
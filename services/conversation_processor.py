@@ -9,6 +9,10 @@ from services.whatsapp_parser import WhatsAppParser
 
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for absent per-message lists; these are only serialized,
+# never mutated, so one immutable empty tuple serves every message
+_NO_ITEMS = ()
+
 class ConversationProcessor:
     """Service for processing conversations from multiple platforms and creating user profiles"""
     
@@ -115,10 +119,10 @@ class ConversationProcessor:
                             'message_id': msg.get('message_id'),
                             'is_dm': msg.get('is_dm', False),
                             'has_media': msg.get('has_media', False),
-                            'reactions': msg.get('reactions', [])
+                            'reactions': msg.get('reactions', _NO_ITEMS)
                         }
                     },
-                    'reactions': msg.get('reactions', []),
+                    'reactions': msg.get('reactions', _NO_ITEMS),
                     'reply_to': msg.get('reply_to')
                 }
                 messages.append(message)
@@ -143,10 +147,10 @@ class ConversationProcessor:
                             'channel_id': msg.get('channel_id'),
                             'guild_id': msg.get('guild_id'),
                             'is_bot': msg.get('is_bot', False),
-                            'attachments': msg.get('attachments', [])
+                            'attachments': msg.get('attachments', _NO_ITEMS)
                         }
                     },
-                    'reactions': msg.get('reactions', []),
+                    'reactions': msg.get('reactions', _NO_ITEMS),
                     'reply_to': msg.get('reply_to')
                 }
                 messages.append(message)
@@ -173,9 +177,9 @@ class ConversationProcessor:
                         'is_group': msg.get('isGroup', False),
                         'conversation_name': msg.get('conversationName', ''),
                         'app_id': msg.get('appId', ''),
-                        **msg.get('platform_specific_data', {})
+                        **(msg.get('platform_specific_data') or {})
                     },
-                    'reactions': msg.get('reactions', []),
+                    'reactions': msg.get('reactions', _NO_ITEMS),
                     'reply_to': msg.get('reply_to')
                 }
                 messages.append(message)
@@ -227,7 +227,7 @@ class ElevenLabsService:
             file_size = os.path.getsize(file_path)
             
             # Extract generation ID from response headers if available
-            generation_id = response.headers.get('xi-generation-id', str(uuid.uuid4()))
+            generation_id = response.headers.get('xi-generation-id') or str(uuid.uuid4())
             
             return {
                 'success': True,
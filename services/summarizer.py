@@ -1,7 +1,6 @@
 import logging
 from typing import List, Dict, Any, Optional
 import openai
-from sqlalchemy.testing.config import test_schema_2
 
 from ..config import Config
 import json
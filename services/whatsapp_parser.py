@@ -1,5 +1,6 @@
 import re
 import logging
+import sys
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dateutil import parser as date_parser
@@ -100,6 +101,8 @@ class WhatsAppParser:
         Returns:
             Parsed message dictionary or None if not a valid message
         """
+        # Usernames are interned: a chat has a handful of participants
+        # repeated across every line, so messages share one string each
         try:
             # Try standard format first
             match = re.match(self.patterns['standard'], line)
@@ -107,7 +110,7 @@ class WhatsAppParser:
                 date_str, time_str, username, content = match.groups()
                 timestamp = self._parse_datetime(date_str, time_str)
                 return {
-                    'username': username.strip(),
+                    'username': sys.intern(username.strip()),
                     'content': content.strip(),
                     'timestamp': timestamp,
                     'message_type': 'text',
@@ -120,7 +123,7 @@ class WhatsAppParser:
                 date_str, time_str, username, content = match.groups()
                 timestamp = self._parse_datetime(date_str, time_str)
                 return {
-                    'username': username.strip(),
+                    'username': sys.intern(username.strip()),
                     'content': content.strip(),
                     'timestamp': timestamp,
                     'message_type': 'text',
@@ -133,7 +136,7 @@ class WhatsAppParser:
                 date_str, time_str, username, filename = match.groups()
                 timestamp = self._parse_datetime(date_str, time_str)
                 return {
-                    'username': username.strip(),
+                    'username': sys.intern(username.strip()),
                     'content': f"<attached: {filename.strip()}>",
                     'timestamp': timestamp,
                     'message_type': 'media',